@@ -0,0 +1,333 @@
+"""Benchmark generator PPT wisuda dengan cohort sintetis.
+
+Contoh:
+    python benchmark.py --sizes 100 1000                 # bandingkan dengan baseline (kalau ada)
+    python benchmark.py --sizes 100 1000 --save-baseline # simpan hasil sebagai baseline baru
+    python benchmark.py --sizes 5000 --generators revisi_pt_1 --parallel --max-workers 4
+
+Setiap ukuran cohort dibuat di workspace sementara (templates/, photos/, wisuda_pagi.xlsx,
+wisuda_siang.xlsx, list_pekerjaan.xlsx) lalu tiap generator (profil layout di profiles/, semua
+lewat engine wisuda.py) dijalankan di subprocess terpisah supaya peak RSS terukur bersih.
+Exit code 1 kalau ada regresi terhadap baseline.
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import zipfile
+import argparse
+import tempfile
+import subprocess
+import pandas as pd
+from PIL import Image
+from layout_profile import available_profiles
+
+try:
+    import resource  # tidak ada di Windows
+except ImportError:
+    resource = None
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(REPO_DIR, 'benchmarks', 'baseline.json')
+GENERATORS = ('revisi_pt_1', 'script')  # default; pilihan lain: available_profiles()
+OUTPUT_DIR = 'bench_output'
+
+PROGRAMS = [
+    'S1 Informatika', 'S1 Sistem Informasi', 'S1 Rekayasa Perangkat Lunak', 'S1 Teknik Elektro',
+    'S1 Teknik Industri', 'S1 Manajemen', 'D3 Teknik Komputer', 'D3 Sistem Informasi',
+]
+FIRST_NAMES = ['Andi', 'Budi', 'Citra', 'Dewi', 'Eka', 'Fajar', 'Gita', 'Hadi', 'Indah', 'Joko',
+               'Kartika', 'Lestari', 'Muhammad', 'Nur', 'Putri', 'Rizky', 'Sari', 'Tri', 'Wahyu', 'Yusuf']
+LAST_NAMES = ['Pratama', 'Saputra', 'Wijaya', 'Santoso', 'Hidayat', 'Kurniawan', 'Lestari',
+              'Nugroho', 'Setiawan', 'Rahmawati', 'Siregar', 'Sihombing', 'Putra', 'Utami']
+LECTURERS = ['Dr. Ahmad Wijaya, S.T., M.T.', 'Prof. Dr. Budi Santoso, S.T., M.T.',
+             'Dr. Citra Dewi, S.T., M.Kom.', 'Ir. Dedi Kusuma, M.Sc.', 'Eko Prasetyo, S.Kom., M.T.']
+COMPANIES = ['PT Telekomunikasi Indonesia', 'PT Bank Central Asia', 'PT Gojek Indonesia',
+             'PT Tokopedia', 'PT Astra International', 'PT Pertamina', 'PT Bukalapak']
+
+
+def make_cohort(size, seed=0, summa_rate=0.03, cumlaude_rate=0.25):
+    """DataFrame `size` wisudawan sintetis, dibagi rata ke sesi Pagi/Siang, program dan sisi L/R."""
+    rng = random.Random(seed)
+    rows = []
+    seats = {}  # (sesi, program) -> nomor kursi berikutnya
+    for i in range(size):
+        sesi = 'Pagi' if i % 2 == 0 else 'Siang'
+        program = PROGRAMS[rng.randrange(len(PROGRAMS))]
+        seat = seats.get((sesi, program), 0)
+        seats[(sesi, program)] = seat + 1
+        roll = rng.random()
+        if roll < summa_rate:
+            predikat = 'Summa Cumlaude'
+        elif roll < summa_rate + cumlaude_rate:
+            predikat = 'Cumlaude'
+        else:
+            predikat = rng.choice(['Sangat Memuaskan', 'Memuaskan', None])
+        rows.append({
+            'SESI': sesi,
+            'PROGRAM STUDI': program,
+            'NAMA MAHASISWA': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}",
+            'NIM': 1200000000 + i,
+            'IPK': round(rng.uniform(2.75, 4.0), 2),
+            'SKOR TAK': rng.randint(40, 600),
+            'Nama Dosen Wali': rng.choice(LECTURERS),
+            'Nama Dosen Pembimbing 1': rng.choice(LECTURERS),
+            'Nama Dosen Pembimbing 2': rng.choice(LECTURERS + [None]),
+            'PREDIKAT KELULUSAN': predikat,
+            'TEMPAT DUDUK': f"{seat // 20 + 1}.{seat % 20 + 1}.{rng.choice('LR')}",
+        })
+    return pd.DataFrame(rows)
+
+
+def _make_photo_variants(folder, photo_size, count=6, seed=0):
+    """Beberapa JPEG sumber beresolusi kamera (noise supaya ukuran file realistis)."""
+    rng = random.Random(seed)
+    paths = []
+    for k in range(count):
+        base = Image.effect_noise(photo_size, 40 + 10 * k).convert('RGB')
+        tint = Image.new('RGB', photo_size, (rng.randint(60, 200), rng.randint(60, 200), rng.randint(60, 200)))
+        path = os.path.join(folder, f'variant_{k}.jpg')
+        Image.blend(base, tint, 0.6).save(path, quality=92)
+        paths.append(path)
+    return paths
+
+
+def build_workspace(root, cohort, photo_size=(2400, 3200), missing_photo_rate=0.05, seed=0, shared_photos=False):
+    """Tulis templates, foto dan file Excel untuk cohort ke folder root.
+
+    Setiap foto diberi byte unik di belakang marker EOI JPEG (isi gambar sama dengan variant,
+    tetapi SHA-1 berbeda seperti foto asli). shared_photos=True memakai hard link ke variant
+    untuk hemat disk; python-pptx lalu menyimpan foto yang sama hanya sekali per deck.
+    """
+    rng = random.Random(seed)
+    for folder, names in [
+        ('templates/template-pt-atas', ['Slide1.PNG', 'Slide2.PNG', 'Slide3.PNG']),
+        ('templates/template-pt', ['Slide1.PNG', 'Slide2.PNG', 'Slide3.PNG']),
+        ('templates', ['bg_non_predikat.png', 'bg_cumlaude.png', 'bg_summa.png']),
+    ]:
+        os.makedirs(os.path.join(root, folder), exist_ok=True)
+        for k, name in enumerate(names):
+            Image.new('RGB', (1440, 1920), (230 - 30 * k, 220, 200 + 20 * k)).save(os.path.join(root, folder, name))
+
+    variants_dir = os.path.join(root, '_photo_variants')
+    os.makedirs(variants_dir, exist_ok=True)
+    variants = _make_photo_variants(variants_dir, photo_size, seed=seed)
+    variant_bytes = []
+    if not shared_photos:
+        for path in variants:
+            with open(path, 'rb') as f:
+                variant_bytes.append(f.read())
+    for program in PROGRAMS:
+        os.makedirs(os.path.join(root, 'photos', program), exist_ok=True)
+    for nim, program in zip(cohort['NIM'], cohort['PROGRAM STUDI']):
+        if rng.random() < missing_photo_rate:
+            continue
+        dest = os.path.join(root, 'photos', program, f"{nim}_graduation_1.jpg")
+        if not shared_photos:
+            with open(dest, 'wb') as f:
+                f.write(variant_bytes[nim % len(variants)] + str(nim).encode('ascii'))
+            continue
+        source = variants[nim % len(variants)]
+        try:
+            os.link(source, dest)  # path berbeda tetap diproses sendiri-sendiri oleh PhotoCache
+        except OSError:
+            shutil.copyfile(source, dest)
+
+    for sesi, file_name in [('Pagi', 'wisuda_pagi.xlsx'), ('Siang', 'wisuda_siang.xlsx')]:
+        cohort[cohort['SESI'] == sesi].drop(columns=['SESI']).to_excel(os.path.join(root, file_name), index=False)
+
+    # Sebagian nama ada di list pekerjaan, sebagian dengan variasi penulisan
+    employed = cohort.sample(frac=0.3, random_state=seed)['NAMA MAHASISWA']
+    names = [name.lower() if k % 4 == 0 else name for k, name in enumerate(employed)]
+    pd.DataFrame({
+        'Nama': names,
+        'Nama Perusahaan': [COMPANIES[k % len(COMPANIES)] for k in range(len(names))],
+    }).to_excel(os.path.join(root, 'list_pekerjaan.xlsx'), index=False)
+
+
+def _peak_rss_mb():
+    """Peak RSS (MB) proses ini dan anak-anaknya (worker pool); None kalau tidak didukung."""
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux: KB, macOS: bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _output_stats(output_dir):
+    """(jumlah slide, total bytes) semua .pptx di output_dir."""
+    slides = 0
+    total_bytes = 0
+    for folder, _, files in os.walk(output_dir):
+        for name in files:
+            if not name.endswith('.pptx'):
+                continue
+            path = os.path.join(folder, name)
+            total_bytes += os.path.getsize(path)
+            with zipfile.ZipFile(path) as z:
+                slides += sum(1 for n in z.namelist() if n.startswith('ppt/slides/slide') and n.endswith('.xml'))
+    return slides, total_bytes
+
+
+def run_generator(generator, parallel=False, max_workers=None, compresslevel=None, store_media=None):
+    """Jalankan satu generator di cwd (workspace) dan kembalikan hasil pengukuran.
+
+    compresslevel/store_media None = default generator (lihat pptx_writer.save_presentation).
+    """
+    sys.path.insert(0, REPO_DIR)
+    start = time.perf_counter()
+    import wisuda
+    wisuda.setup_logging('ERROR')
+    gen = wisuda.GraduationPPTGenerator(timing_report=None, pptx_compresslevel=compresslevel,
+                                        pptx_store_media=store_media, profile=generator)
+    gen.process_graduation_data(OUTPUT_DIR, parallel=parallel, max_workers=max_workers)
+    stages = gen.timer.as_dict()
+    seconds = time.perf_counter() - start
+
+    slides, output_bytes = _output_stats(OUTPUT_DIR)
+    return {
+        'seconds': round(seconds, 3),
+        'slides': slides,
+        'slides_per_sec': round(slides / seconds, 2) if seconds else None,
+        'peak_rss_mb': None if _peak_rss_mb() is None else round(_peak_rss_mb(), 1),
+        'output_bytes': output_bytes,
+        'stages': stages,
+    }
+
+
+def measure(generator, workspace, parallel=False, max_workers=None, warm=False, compresslevel=None, deflate_media=False):
+    """Ukur generator di subprocess baru (cache dan output lama dihapus kecuali warm=True)."""
+    for folder in [OUTPUT_DIR] + ([] if warm else ['.excel_cache', '.photo_cache']):
+        shutil.rmtree(os.path.join(workspace, folder), ignore_errors=True)
+    command = [sys.executable, os.path.abspath(__file__), '--run-one', generator]
+    if parallel:
+        command.append('--parallel')
+    if max_workers:
+        command += ['--max-workers', str(max_workers)]
+    if compresslevel is not None:
+        command += ['--compresslevel', str(compresslevel)]
+    if deflate_media:
+        command.append('--deflate-media')
+    completed = subprocess.run(command, cwd=workspace, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{generator} failed:\n{completed.stderr[-2000:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def case_key(generator, size, parallel, warm=False, compresslevel=None, deflate_media=False):
+    key = f"{generator}/{size}/{'parallel' if parallel else 'serial'}"
+    if compresslevel is not None or deflate_media:
+        key += f"/z{'' if compresslevel is None else compresslevel}{'+media' if deflate_media else ''}"
+    return key + '/warm' if warm else key
+
+
+def find_regressions(result, baseline, tolerance):
+    """Daftar pesan regresi: throughput turun, atau peak RSS / ukuran output naik > tolerance."""
+    problems = []
+    checks = [
+        ('slides_per_sec', lambda new, old: new < old * (1 - tolerance)),
+        ('peak_rss_mb', lambda new, old: new > old * (1 + tolerance)),
+        ('output_bytes', lambda new, old: new > old * (1 + tolerance)),
+    ]
+    for metric, is_worse in checks:
+        new, old = result.get(metric), baseline.get(metric)
+        if new is not None and old and is_worse(new, old):
+            problems.append(f"{metric}: {old} -> {new} ({(new - old) / old:+.1%})")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark generator PPT wisuda dengan cohort sintetis.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000], help='ukuran cohort (100 - 20000)')
+    parser.add_argument('--generators', nargs='+', choices=available_profiles(), default=list(GENERATORS),
+                        help='profil layout yang diukur')
+    parser.add_argument('--parallel', action='store_true', help='jalankan dengan PARALLEL')
+    parser.add_argument('--max-workers', type=int, default=None)
+    parser.add_argument('--photo-size', type=int, nargs=2, default=[2400, 3200], metavar=('W', 'H'))
+    parser.add_argument('--missing-photo-rate', type=float, default=0.05)
+    parser.add_argument('--shared-photos', action='store_true',
+                        help='hard link foto ke beberapa variant (hemat disk, tapi foto ter-deduplikasi di deck)')
+    parser.add_argument('--summa-rate', type=float, default=0.03)
+    parser.add_argument('--cumlaude-rate', type=float, default=0.25)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--compresslevel', type=int, choices=range(10), default=None,
+                        help='level deflate part XML di file .pptx (default: default generator)')
+    parser.add_argument('--deflate-media', action='store_true', help='deflate juga foto/latar (default: disimpan apa adanya)')
+    parser.add_argument('--warm', action='store_true', help='pakai cache Excel/foto dari run sebelumnya (run pemanasan dulu)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='file JSON baseline')
+    parser.add_argument('--save-baseline', action='store_true', help='simpan hasil run ini sebagai baseline')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='batas regresi relatif (default 0.15)')
+    parser.add_argument('--results', default=None, help='simpan hasil lengkap (termasuk stage) ke file JSON ini')
+    parser.add_argument('--keep', action='store_true', help='jangan hapus workspace sementara')
+    parser.add_argument('--run-one', choices=available_profiles(), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_one:
+        # Mode subprocess: cwd = workspace, hasil dicetak sebagai JSON di baris terakhir
+        print(json.dumps(run_generator(args.run_one, parallel=args.parallel, max_workers=args.max_workers,
+                                       compresslevel=args.compresslevel,
+                                       store_media=False if args.deflate_media else None)))
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    print(f"{'Case':<40} {'Slides':>7} {'Seconds':>9} {'Slides/s':>9} {'Peak MB':>8} {'Output MB':>10} {'Save s':>7}")
+    for size in args.sizes:
+        workspace = tempfile.mkdtemp(prefix=f'wisuda_bench_{size}_')
+        try:
+            cohort = make_cohort(size, seed=args.seed, summa_rate=args.summa_rate, cumlaude_rate=args.cumlaude_rate)
+            build_workspace(workspace, cohort, photo_size=tuple(args.photo_size),
+                            missing_photo_rate=args.missing_photo_rate, seed=args.seed,
+                            shared_photos=args.shared_photos)
+            for generator in args.generators:
+                parallel = args.parallel
+                options = {'compresslevel': args.compresslevel, 'deflate_media': args.deflate_media}
+                if args.warm:
+                    measure(generator, workspace, parallel, args.max_workers, **options)
+                result = measure(generator, workspace, parallel, args.max_workers, warm=args.warm, **options)
+                key = case_key(generator, size, parallel, args.warm, **options)
+                results[key] = result
+                peak = '-' if result['peak_rss_mb'] is None else f"{result['peak_rss_mb']:.1f}"
+                save = result['stages'].get('save')
+                save_seconds = '-' if save is None else f"{save['seconds']:.2f}"
+                print(f"{key:<40} {result['slides']:>7} {result['seconds']:>9.2f} {result['slides_per_sec']:>9.2f} "
+                      f"{peak:>8} {result['output_bytes'] / 1e6:>10.2f} {save_seconds:>7}")
+                if key in baseline:
+                    for problem in find_regressions(result, baseline[key], args.tolerance):
+                        regressions.append(f"{key}: {problem}")
+        finally:
+            if args.keep:
+                print(f"  workspace kept: {workspace}")
+            else:
+                shutil.rmtree(workspace, ignore_errors=True)
+
+    if args.results:
+        with open(args.results, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        baseline.update({key: {k: v for k, v in result.items() if k != 'stages'} for key, result in results.items()})
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved: {args.baseline}")
+    elif baseline:
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
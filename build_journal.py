@@ -0,0 +1,84 @@
+import json
+import os
+import threading
+import time
+
+
+class BuildJournal:
+    """Checkpoint append-only (JSONL) untuk deck yang selesai dibangun di satu folder output.
+
+    Satu baris per deck, ditulis dan di-fsync begitu deck selesai (juga dari writer thread):
+        {"output": path relatif, "fingerprint", "status": "ok"/"failed", "slides", "sha256", "bytes",
+         "mtime_ns", "error", "time"}
+    Kalau proses mati di tengah run, deck yang sudah selesai tetap tercatat; baris terakhir yang
+    terpotong diabaikan saat dibaca. Entri terakhir per output yang berlaku.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Entri terakhir per output: {output: entry}. Journal tidak ada = kosong."""
+        entries = {}
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return entries
+        with f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # baris terpotong saat crash
+                if isinstance(entry, dict) and 'output' in entry:
+                    entries[entry['output']] = entry
+        return entries
+
+    def open(self, resume=False):
+        """Mulai mencatat; tanpa resume journal lama dikosongkan."""
+        if resume and os.path.exists(self.path):
+            # Baris terakhir yang terpotong ditutup dulu supaya entri baru tidak ikut rusak
+            torn = False
+            with open(self.path, 'rb') as f:
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    torn = f.read(1) != b'\n'
+            self._file = open(self.path, 'a', encoding='utf-8')
+            if torn:
+                self._file.write('\n')
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+        return self
+
+    def record(self, output, fingerprint, result):
+        """Catat hasil satu deck (dict result dari build_deck/save_deck)."""
+        entry = {
+            'output': output,
+            'fingerprint': fingerprint,
+            'status': 'failed' if result.get('error') else 'ok',
+            'slides': result.get('slides', 0),
+            'sha256': result.get('sha256'),
+            'bytes': result.get('bytes'),
+            'mtime_ns': result.get('mtime_ns'),
+            'error': result.get('error'),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        line = json.dumps(entry, sort_keys=True) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
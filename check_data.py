@@ -1,9 +1,9 @@
-import pandas as pd
+from excel_cache import read_excel_cached
 
 # Check list_pekerjaan.xlsx
 print("=== LIST PEKERJAAN ===")
 try:
-    df_pekerjaan = pd.read_excel('list_pekerjaan.xlsx')
+    df_pekerjaan = read_excel_cached('list_pekerjaan.xlsx')
     print(f"Rows: {len(df_pekerjaan)}")
     print(f"Columns: {list(df_pekerjaan.columns)}")
     print("First 5 rows:")
@@ -16,7 +16,7 @@ except Exception as e:
 
 print("\n=== WISUDA PAGI ===")
 try:
-    df_pagi = pd.read_excel('wisuda_pagi.xlsx')
+    df_pagi = read_excel_cached('wisuda_pagi.xlsx')
     print(f"Rows: {len(df_pagi)}")
     print(f"Columns: {list(df_pagi.columns)}")
     print("Sample names:")
@@ -27,7 +27,7 @@ except Exception as e:
 
 print("\n=== WISUDA SIANG ===")
 try:
-    df_siang = pd.read_excel('wisuda_siang.xlsx')
+    df_siang = read_excel_cached('wisuda_siang.xlsx')
     print(f"Rows: {len(df_siang)}")
     print(f"Columns: {list(df_siang.columns)}")
     print("Sample names:")
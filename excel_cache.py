@@ -0,0 +1,112 @@
+import os
+import json
+import hashlib
+import logging
+import importlib.util
+import pandas as pd
+
+logger = logging.getLogger('wisuda.excel_cache')
+
+CACHE_DIR = '.excel_cache'
+
+
+def _excel_engine():
+    """Engine tercepat yang tersedia: calamine (python-calamine) kalau ada, selain itu openpyxl."""
+    if importlib.util.find_spec('python_calamine') is not None:
+        return 'calamine'
+    return 'openpyxl'
+
+
+def _cache_format():
+    """Parquet kalau pyarrow tersedia, selain itu pickle."""
+    if importlib.util.find_spec('pyarrow') is not None:
+        return 'parquet'
+    return 'pickle'
+
+
+def _file_sha256(path):
+    """SHA-256 isi file (dibaca per blok)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_cache(cache_file, fmt):
+    if fmt == 'parquet':
+        return pd.read_parquet(cache_file)
+    return pd.read_pickle(cache_file)
+
+
+def _write_cache(df, cache_base):
+    """Simpan DataFrame sebagai Parquet (fallback pickle kalau tipe kolom tidak didukung)."""
+    if _cache_format() == 'parquet':
+        try:
+            df.to_parquet(cache_base + '.parquet', index=False)
+            return 'parquet'
+        except Exception as e:
+            logger.warning(f"Parquet cache not possible ({e}), using pickle")
+    df.to_pickle(cache_base + '.pkl')
+    return 'pickle'
+
+
+def read_excel_cached(file_path, columns=None, cache_dir=CACHE_DIR):
+    """Baca sheet pertama file Excel, hanya kolom `columns` (None = semua kolom).
+
+    Hasil parsing disimpan di cache_dir. Cache dipakai lagi selama mtime + ukuran file sama,
+    atau isi file (SHA-256) masih sama walaupun mtime berubah. Kolom di `columns` yang tidak ada
+    di file diabaikan.
+    """
+    st = os.stat(file_path)
+    wanted = None if columns is None else list(columns)
+    key = f"{os.path.abspath(file_path)}|{wanted}"
+    cache_base = os.path.join(cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest())
+    meta_file = cache_base + '.json'
+
+    meta = None
+    sha256 = None
+    if os.path.exists(meta_file):
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except Exception:
+            meta = None
+
+    if meta:
+        cache_file = cache_base + ('.parquet' if meta['format'] == 'parquet' else '.pkl')
+        try:
+            if meta['mtime'] == st.st_mtime and meta['size'] == st.st_size:
+                return _read_cache(cache_file, meta['format'])
+            sha256 = _file_sha256(file_path)
+            if meta['sha256'] == sha256:
+                # File di-touch/disalin tanpa perubahan isi
+                df = _read_cache(cache_file, meta['format'])
+                meta.update({'mtime': st.st_mtime, 'size': st.st_size})
+                with open(meta_file, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f)
+                return df
+        except Exception as e:
+            logger.warning(f"Ignoring broken Excel cache for {file_path}: {e}")
+
+    wanted_set = None if wanted is None else set(wanted)
+    df = pd.read_excel(
+        file_path,
+        engine=_excel_engine(),
+        usecols=None if wanted_set is None else (lambda c: c in wanted_set),
+    )
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fmt = _write_cache(df, cache_base)
+        with open(meta_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'source': os.path.abspath(file_path),
+                'mtime': st.st_mtime,
+                'size': st.st_size,
+                'sha256': sha256 or _file_sha256(file_path),
+                'format': fmt,
+            }, f)
+    except Exception as e:
+        logger.warning(f"Could not write Excel cache for {file_path}: {e}")
+    return df
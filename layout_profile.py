@@ -0,0 +1,133 @@
+import json
+import os
+from pptx.enum.text import PP_ALIGN
+
+# Folder profil bawaan (di samping modul ini); profil lain bisa dipakai lewat path file .json
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiles')
+
+# Field yang bisa dipetakan ke kotak teks; nilainya disusun di GraduationPPTGenerator.add_student_info
+FIELDS = (
+    'PROGRAM STUDI', 'NAMA MAHASISWA', 'NIM', 'IPK', 'SKOR TAK',
+    'DITERIMA DI', 'PERUSAHAAN', 'Nama Dosen Wali', 'DOSEN PEMBIMBING',
+)
+PREDIKAT_TEMPLATES = ('Non Predikat', 'CUMLAUDE', 'SUMMA CUMLAUDE')
+ALIGNMENTS = {'left': PP_ALIGN.LEFT, 'center': PP_ALIGN.CENTER, 'right': PP_ALIGN.RIGHT}
+GROUPING_DEFAULTS = {
+    'split_summa': True,       # summa cumlaude satu sesi dikumpulkan di <sesi>/summa/summa.pptx
+    'split_sides': True,       # per program dua file duduk_l.pptx / duduk_r.pptx (False = <program>.pptx)
+    'sort_by_predikat': True,  # urut predikat dulu baru kursi (False = urut kursi saja)
+}
+
+
+class LayoutProfile:
+    """Layout satu set output: template per predikat, kotak teks per field, frame foto, grouping deck.
+
+    Dibaca dari JSON (lihat profiles/*.json):
+        name, output_dir, test_output_dir (opsional, default <output_dir>/Test), test_program,
+        templates {predikat: path}, photo_frame {left, top, width, height} dalam CM,
+        text_fields [{field, left, top, width, height (CM), font_size (pt), align}],
+        company: "lookup" (list_pekerjaan.xlsx), {"text": "..."} (teks tetap) atau null,
+        grouping: lihat GROUPING_DEFAULTS.
+    """
+
+    def __init__(self, name, output_dir, templates, text_fields, photo_frame, company=None, grouping=None,
+                 test_output_dir=None, test_program='S1 Rekayasa Perangkat Lunak'):
+        self.name = name
+        self.output_dir = output_dir
+        self.test_output_dir = test_output_dir or os.path.join(output_dir, 'Test')
+        self.test_program = test_program
+        self.templates = dict(templates)
+        # (field, left, top, width, height, font_size, alignment) - bentuk tuple yang dipakai generator
+        self.text_fields = [tuple(field) for field in text_fields]
+        self.photo_frame = tuple(photo_frame)  # (left, top, width, height) dalam CM
+        self.company = company
+        self.grouping = dict(GROUPING_DEFAULTS, **(grouping or {}))
+
+    @classmethod
+    def from_dict(cls, data, source='<dict>'):
+        def fail(message):
+            raise ValueError(f"Invalid layout profile {source}: {message}")
+
+        for key in ('output_dir', 'templates', 'text_fields', 'photo_frame'):
+            if key not in data:
+                fail(f"missing '{key}'")
+
+        templates = data['templates']
+        missing = [p for p in PREDIKAT_TEMPLATES if p not in templates]
+        if missing:
+            fail(f"templates missing {missing}")
+
+        text_fields = []
+        for spec in data['text_fields']:
+            if spec.get('field') not in FIELDS:
+                fail(f"unknown field {spec.get('field')!r} (expected one of {list(FIELDS)})")
+            align = spec.get('align', 'left')
+            if align not in ALIGNMENTS:
+                fail(f"unknown align {align!r} for {spec['field']}")
+            try:
+                text_fields.append((
+                    spec['field'], float(spec['left']), float(spec['top']), float(spec['width']),
+                    float(spec['height']), int(spec['font_size']), ALIGNMENTS[align],
+                ))
+            except (KeyError, TypeError, ValueError) as e:
+                fail(f"bad box for {spec['field']}: {e!r}")
+
+        frame = data['photo_frame']
+        try:
+            photo_frame = (float(frame['left']), float(frame['top']), float(frame['width']), float(frame['height']))
+        except (KeyError, TypeError, ValueError) as e:
+            fail(f"bad photo_frame: {e!r}")
+
+        company = data.get('company')
+        if not (company is None or company == 'lookup' or (isinstance(company, dict) and 'text' in company)):
+            fail(f"company must be \"lookup\", {{\"text\": ...}} or null, got {company!r}")
+
+        grouping = data.get('grouping') or {}
+        unknown = [key for key in grouping if key not in GROUPING_DEFAULTS]
+        if unknown:
+            fail(f"unknown grouping keys {unknown}")
+
+        return cls(
+            name=data.get('name') or os.path.splitext(os.path.basename(source))[0],
+            output_dir=data['output_dir'],
+            templates=templates,
+            text_fields=text_fields,
+            photo_frame=photo_frame,
+            company=company,
+            grouping=grouping,
+            test_output_dir=data.get('test_output_dir'),
+            test_program=data.get('test_program', 'S1 Rekayasa Perangkat Lunak'),
+        )
+
+    @property
+    def fixed_company(self):
+        """Teks perusahaan tetap untuk semua mahasiswa (company {"text": ...}), selain itu None."""
+        return self.company['text'] if isinstance(self.company, dict) else None
+
+    def __repr__(self):
+        return f"LayoutProfile({self.name!r}, output_dir={self.output_dir!r})"
+
+
+def profile_path(name):
+    """Nama profil bawaan (mis. 'revisi_pt') atau path ke file .json."""
+    if name.endswith('.json') or os.path.sep in name:
+        return name
+    return os.path.join(PROFILE_DIR, f"{name}.json")
+
+
+def available_profiles():
+    """Nama profil bawaan di PROFILE_DIR."""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    return sorted(os.path.splitext(f)[0] for f in os.listdir(PROFILE_DIR) if f.endswith('.json'))
+
+
+def load_profile(name):
+    """Baca LayoutProfile dari nama profil bawaan atau path file JSON."""
+    if isinstance(name, LayoutProfile):
+        return name
+    path = profile_path(name)
+    if not os.path.exists(path):
+        raise ValueError(f"Layout profile not found: {name} (available: {', '.join(available_profiles())})")
+    with open(path, 'r', encoding='utf-8') as f:
+        return LayoutProfile.from_dict(json.load(f), source=path)
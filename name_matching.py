@@ -0,0 +1,107 @@
+import re
+import math
+import unicodedata
+
+# Gelar di depan nama (setelah tanda baca dibuang)
+_PREFIX_TITLES = {'DR', 'DRS', 'DRA', 'IR', 'PROF', 'H', 'HJ', 'KH', 'TN', 'NY', 'SDR', 'SDRI'}
+
+
+def normalize_name(name):
+    """Normalisasi nama untuk pencocokan: tanpa aksen, gelar, tanda baca dan spasi ganda; UPPERCASE."""
+    if name is None:
+        return ''
+    text = str(name)
+    if text.strip().lower() == 'nan':
+        return ''
+    # Gelar akademik di belakang koma ("Budi, S.T., M.T.")
+    text = text.split(',', 1)[0]
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).upper()
+    tokens = re.sub(r'[^0-9A-Z]+', ' ', text).split()
+    while len(tokens) > 1 and tokens[0] in _PREFIX_TITLES:
+        tokens.pop(0)
+    return ' '.join(tokens)
+
+
+def _number_tokens(normalized):
+    """Token angka dalam nama; harus sama persis, bukan dianggap salah ketik."""
+    return frozenset(token for token in normalized.split() if token.isdigit())
+
+
+def _ngrams(normalized, n):
+    """Set n-gram karakter per kata (kata diberi padding spasi, jadi urutan kata tidak berpengaruh)."""
+    grams = set()
+    for token in normalized.split():
+        padded = f" {token} "
+        if len(padded) <= n:
+            grams.add(padded)
+        else:
+            grams.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+class NameMatcher:
+    """Fuzzy matching nama dengan blocking lewat inverted index n-gram.
+
+    Skor = koefisien Dice antar himpunan n-gram. Untuk mencapai threshold, kandidat wajib
+    memuat minimal satu dari beberapa n-gram paling jarang milik nama yang dicari (prefix
+    filtering), jadi hanya posting list pendek yang dibaca dan hanya sedikit pasangan yang
+    diberi skor. Token angka harus sama persis.
+    """
+
+    def __init__(self, names, threshold=0.9, ngram=3):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.ngram = ngram
+        self.names = [normalize_name(name) for name in names]
+        self.exact = {}   # nama normal -> posisi (entri terakhir menang, seperti dict)
+        self.grams = []   # posisi -> set n-gram
+        self.numbers = [_number_tokens(normalized) for normalized in self.names]
+        self.index = {}   # n-gram -> [posisi]
+        for pos, normalized in enumerate(self.names):
+            if not normalized:
+                self.grams.append(set())
+                continue
+            self.exact[normalized] = pos
+            grams = _ngrams(normalized, ngram)
+            self.grams.append(grams)
+            for gram in grams:
+                self.index.setdefault(gram, []).append(pos)
+
+    def match(self, name):
+        """Cari nama paling mirip: (posisi, skor) atau (None, skor terbaik) kalau di bawah threshold."""
+        normalized = normalize_name(name)
+        if not normalized:
+            return None, 0.0
+        if normalized in self.exact:
+            return self.exact[normalized], 1.0
+
+        grams = _ngrams(normalized, self.ngram)
+        numbers = _number_tokens(normalized)
+        size = len(grams)
+        t = self.threshold
+
+        # Dice >= t  =>  overlap >= t * size / (2 - t)  dan  ukuran kandidat dalam batas berikut
+        # (toleransi 1e-9: batas tepat di skor = threshold tidak boleh hilang karena pembulatan float)
+        min_overlap = max(1, math.ceil(t * size / (2 - t) - 1e-9))
+        min_size = t * size / (2 - t) - 1e-9
+        max_size = size * (2 - t) / t + 1e-9
+
+        rare_first = sorted(grams, key=lambda gram: len(self.index.get(gram, ())))
+        candidates = set()
+        for gram in rare_first[:size - min_overlap + 1]:
+            candidates.update(self.index.get(gram, ()))
+
+        best_pos, best_score = None, 0.0
+        for pos in candidates:
+            candidate = self.grams[pos]
+            if not min_size <= len(candidate) <= max_size or self.numbers[pos] != numbers:
+                continue
+            score = 2.0 * len(grams & candidate) / (size + len(candidate))
+            if score > best_score:
+                best_pos, best_score = pos, score
+
+        if best_score >= self.threshold:
+            return best_pos, best_score
+        return None, best_score
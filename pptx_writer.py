@@ -0,0 +1,140 @@
+import hashlib
+import os
+import stat
+import tempfile
+import zipfile
+import pptx
+from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+
+# Modul ini (dan slide builder di wisuda.py) memakai API internal python-pptx
+# (_ZipPkgWriter, PackageWriter._write, _next_slide_partname, _add_sldLayoutId, shapes._spTree)
+# yang hanya teruji di seri 1.0.x - lihat pin di requirements.txt.
+SUPPORTED_PPTX_SERIES = (1, 0)
+if tuple(int(v) for v in pptx.__version__.split('.')[:2]) != SUPPORTED_PPTX_SERIES:
+    raise ImportError(
+        f"python-pptx {pptx.__version__} is not supported (needs "
+        f"{'.'.join(map(str, SUPPORTED_PPTX_SERIES))}.x): pip install -r requirements.txt"
+    )
+
+# Ekstensi part yang sudah terkompresi (atau biner) - deflate hampir tidak mengecilkan
+MEDIA_EXTENSIONS = {'jpg', 'jpeg', 'png', 'gif', 'tif', 'tiff', 'bmp', 'wdp', 'mp3', 'mp4', 'm4a', 'wav', 'avi'}
+# File temp save_presentation_atomic: .<nama>.<acak>.pptx-tmp di folder tujuan
+TEMP_SUFFIX = '.pptx-tmp'
+
+
+def _default_file_mode():
+    """Mode file baru seperti open() biasa (0o666 dikurangi umask); dibaca sekali saat import."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# mkstemp membuat file 0600; file temp di-chmod ke mode ini (atau mode file lama) sebelum rename
+DEFAULT_FILE_MODE = _default_file_mode()
+
+
+class _CompressionZipWriter(_ZipPkgWriter):
+    """Zip writer python-pptx dengan level deflate yang bisa dipilih dan media tanpa kompresi."""
+
+    def __init__(self, pkg_file, compresslevel=6, store_media=True):
+        super().__init__(pkg_file)
+        self.compresslevel = compresslevel
+        self.store_media = store_media
+
+    def write(self, pack_uri, blob):
+        if self.compresslevel == 0 or (self.store_media and pack_uri.ext.lower() in MEDIA_EXTENSIONS):
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_DEFLATED,
+                                compresslevel=self.compresslevel)
+
+
+class _CompressionPackageWriter(PackageWriter):
+    def __init__(self, pkg_file, pkg_rels, parts, compresslevel, store_media):
+        super().__init__(pkg_file, pkg_rels, parts)
+        self.compresslevel = compresslevel
+        self.store_media = store_media
+
+    def _write(self):
+        with _CompressionZipWriter(self._pkg_file, self.compresslevel, self.store_media) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+
+def save_presentation(prs, file, compresslevel=6, store_media=True):
+    """Seperti prs.save(file), dengan pilihan kompresi zip.
+
+    compresslevel: level deflate 1-9 untuk part XML (0 = semua part disimpan tanpa kompresi).
+    store_media: gambar/media (sudah terkompresi) disimpan apa adanya, tidak di-deflate ulang.
+    """
+    if not 0 <= compresslevel <= 9:
+        raise ValueError(f"compresslevel must be 0-9, got {compresslevel}")
+    package = prs.part.package
+    _CompressionPackageWriter(file, package._rels, tuple(package.iter_parts()), compresslevel, store_media)._write()
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """SHA-256 (hex) isi file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fsync_dir(path):
+    """fsync folder supaya rename-nya ikut tersimpan (tidak didukung di Windows)."""
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def save_presentation_atomic(prs, path, compresslevel=6, store_media=True):
+    """save_presentation ke file temp di folder yang sama, fsync, lalu os.replace ke path.
+
+    Kalau proses mati di tengah jalan, path tetap berisi file lama (atau tidak ada) - tidak
+    pernah setengah tertulis; paling-paling tersisa file .tmp (lihat remove_stale_temp_files).
+    Return (sha256, bytes) file yang tersimpan.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=TEMP_SUFFIX, dir=directory)
+    try:
+        with os.fdopen(fd, 'w+b') as f:
+            save_presentation(prs, f, compresslevel=compresslevel, store_media=store_media)
+            f.flush()
+            os.fsync(f.fileno())
+        sha256 = file_sha256(tmp_path)
+        size = os.path.getsize(tmp_path)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = DEFAULT_FILE_MODE
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+    return sha256, size
+
+
+def remove_stale_temp_files(root):
+    """Hapus file temp sisa save_presentation_atomic yang terputus di bawah root. Return jumlahnya."""
+    removed = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.startswith('.') and name.endswith(TEMP_SUFFIX):
+                try:
+                    os.unlink(os.path.join(dirpath, name))
+                    removed += 1
+                except OSError:
+                    pass
+    return removed
@@ -0,0 +1,78 @@
+import json
+import time
+
+
+class _Stage:
+    """Context manager satu pengukuran; dipakai ulang per nama stage supaya murah di hot path."""
+    __slots__ = ('stats', 'start')
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        stats = self.stats
+        stats['seconds'] += time.perf_counter() - self.start
+        stats['calls'] += 1
+        return False
+
+
+class StageTimer:
+    """Catat wall time, jumlah panggilan dan bytes per stage pipeline, total dan per deck.
+
+    Waktu stage bersarang bersifat inklusif (mis. 'create_slide' sudah termasuk 'photo_fit').
+    Timer per deck dibuat di build_deck (juga di worker process), dikirim balik sebagai dict
+    lewat as_dict() dan digabung ke timer run dengan merge().
+    """
+
+    def __init__(self):
+        self.stages = {}  # nama -> {'seconds', 'calls', 'bytes'}
+        self.decks = {}   # output_file -> {nama -> {...}}
+        self._contexts = {}
+
+    def _stats(self, name):
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = {'seconds': 0.0, 'calls': 0, 'bytes': 0}
+        return stats
+
+    def stage(self, name):
+        """`with timer.stage('save'):` - tidak reentrant untuk nama yang sama."""
+        context = self._contexts.get(name)
+        if context is None:
+            context = self._contexts[name] = _Stage(self._stats(name))
+        return context
+
+    def add_bytes(self, name, count):
+        self._stats(name)['bytes'] += int(count)
+
+    def as_dict(self):
+        return {name: dict(stats) for name, stats in self.stages.items()}
+
+    def merge(self, stages, deck=None):
+        """Tambahkan hasil as_dict() timer lain; kalau deck diisi, simpan juga per deck."""
+        for name, stats in stages.items():
+            total = self._stats(name)
+            total['seconds'] += stats['seconds']
+            total['calls'] += stats['calls']
+            total['bytes'] += stats['bytes']
+        if deck is not None:
+            self.decks[deck] = {name: dict(stats) for name, stats in stages.items()}
+
+    def summary_table(self):
+        """Tabel teks: stage, calls, total detik, ms per call, bytes."""
+        lines = [f"{'Stage':<20} {'Calls':>8} {'Total s':>10} {'ms/call':>10} {'Bytes':>14}"]
+        for name, stats in self.stages.items():
+            per_call = stats['seconds'] * 1000 / stats['calls'] if stats['calls'] else 0.0
+            lines.append(
+                f"{name:<20} {stats['calls']:>8} {stats['seconds']:>10.3f} {per_call:>10.2f} {stats['bytes']:>14,}"
+            )
+        return '\n'.join(lines)
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'stages': self.stages, 'decks': self.decks}, f, indent=2)
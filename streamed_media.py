@@ -0,0 +1,61 @@
+import os
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import Image, ImagePart
+
+
+class StreamedImagePart(ImagePart):
+    """ImagePart yang hanya menyimpan path file; isinya baru dibaca saat prs.save().
+
+    python-pptx menulis part satu per satu ke zip, jadi dengan part ini hanya satu gambar
+    yang ada di memori saat save, berapa pun jumlah slide-nya. File sumber harus tetap ada
+    dan tidak berubah sampai presentasi disimpan.
+    """
+
+    def __init__(self, partname, package, image, path):
+        super().__init__(partname, image.content_type, package, None, os.path.basename(path))
+        self._path = path
+        self._sha1 = image.sha1
+        self._size = image.size
+        self._image_dpi = image.dpi
+
+    @property
+    def blob(self):
+        with open(self._path, 'rb') as f:
+            return f.read()
+
+    @property
+    def image(self):
+        return Image.from_file(self._path)
+
+    @property
+    def sha1(self):
+        return self._sha1
+
+    @property
+    def _px_size(self):
+        return self._size
+
+    @property
+    def _dpi(self):
+        return self._image_dpi
+
+
+class StreamedMedia:
+    """StreamedImagePart per isi file untuk satu package (dipegang DeckContext, ikut dilepas bersama deck)."""
+
+    def __init__(self, package):
+        self.package = package
+        self._by_sha1 = {}  # sha1 -> StreamedImagePart
+
+    def get_part(self, image_path):
+        """StreamedImagePart untuk image_path (file yang sama isinya dipakai ulang).
+
+        Partname memakai pola /ppt/media/photoN supaya tidak bentrok dengan penomoran imageN milik
+        python-pptx, dan tidak perlu menelusuri semua part tiap kali gambar ditambahkan.
+        """
+        image = Image.from_file(image_path)
+        part = self._by_sha1.get(image.sha1)
+        if part is None:
+            partname = PackURI(f"/ppt/media/photo{len(self._by_sha1) + 1}.{image.ext}")
+            part = self._by_sha1[image.sha1] = StreamedImagePart(partname, self.package, image, image_path)
+        return part
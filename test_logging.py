@@ -0,0 +1,44 @@
+"""
+Test log file: baris proses utama tidak boleh terduplikasi oleh worker hasil fork
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import wisuda
+
+
+def _log_from_worker(i):
+    wisuda.logger.info(f"worker line {i}")
+    wisuda.flush_logging()
+    return i
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="needs fork start method")
+def test_forked_workers_do_not_rewrite_main_process_buffer(tmp_path):
+    """Worker mewarisi buffer MemoryHandler yang belum di-flush; setup_logging di worker harus membuangnya"""
+    log_file = tmp_path / 'run.log'
+    try:
+        wisuda.setup_logging('INFO', str(log_file))
+        for i in range(5):
+            wisuda.logger.info(f"main line {i}")
+        # Sengaja tanpa flush_logging(): buffer masih berisi baris di atas saat fork
+        with ProcessPoolExecutor(max_workers=3, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=wisuda.setup_logging,
+                                 initargs=wisuda._worker_logging_initargs()) as executor:
+            assert sorted(executor.map(_log_from_worker, range(6))) == list(range(6))
+        wisuda.logger.info("main done")
+        wisuda.flush_logging()
+    finally:
+        wisuda.setup_logging('INFO', None)
+        logging.getLogger('wisuda').handlers.clear()
+
+    lines = log_file.read_text(encoding='utf-8').splitlines()
+    for i in range(5):
+        assert sum(line.endswith(f"main line {i}") for line in lines) == 1
+    for i in range(6):
+        assert sum(line.endswith(f"worker line {i}") for line in lines) == 1
+    assert sum(line.endswith("main done") for line in lines) == 1
@@ -5,6 +5,8 @@ Test script untuk memverifikasi logika pencocokan nama
 
 import pandas as pd
 import os
+import random
+from name_matching import NameMatcher, normalize_name, _ngrams
 
 def test_name_matching():
     """Test pencocokan nama antara file wisuda dan list_pekerjaan"""
@@ -28,6 +30,8 @@ def test_name_matching():
         
         print(f"\nTotal lookup entries: {len(lookup)}")
         print(f"Sample entries: {dict(list(lookup.items())[:5])}")
+        lookup_names = list(lookup.keys())
+        matcher = NameMatcher(lookup_names)
     else:
         print("list_pekerjaan.xlsx not found!")
         return
@@ -42,6 +46,7 @@ def test_name_matching():
         
         if 'NAMA MAHASISWA' in df_pagi.columns:
             matches_found = 0
+            fuzzy_found = 0
             total_students = 0
             
             for _, student in df_pagi.iterrows():
@@ -55,11 +60,17 @@ def test_name_matching():
                         matches_found += 1
                         print(f"MATCH: '{nama}' -> '{nama_upper}' -> '{perusahaan}'")
                     else:
-                        print(f"NO MATCH: '{nama}' -> '{nama_upper}'")
+                        pos, score = matcher.match(nama)
+                        if pos is not None:
+                            fuzzy_found += 1
+                            print(f"FUZZY MATCH: '{nama}' ~ '{lookup_names[pos]}' (score {score:.2f}) -> '{lookup[lookup_names[pos]]}'")
+                        else:
+                            print(f"NO MATCH: '{nama}' -> '{nama_upper}' (best score {score:.2f})")
             
             print(f"\nPagi Session Results:")
             print(f"Total students: {total_students}")
             print(f"Matches found: {matches_found}")
+            print(f"Fuzzy matches found: {fuzzy_found}")
             print(f"Match rate: {(matches_found/total_students*100):.1f}%" if total_students > 0 else "No students")
     
     # Test siang data
@@ -69,6 +80,7 @@ def test_name_matching():
         
         if 'NAMA MAHASISWA' in df_siang.columns:
             matches_found = 0
+            fuzzy_found = 0
             total_students = 0
             
             for _, student in df_siang.iterrows():
@@ -82,12 +94,104 @@ def test_name_matching():
                         matches_found += 1
                         print(f"MATCH: '{nama}' -> '{nama_upper}' -> '{perusahaan}'")
                     else:
-                        print(f"NO MATCH: '{nama}' -> '{nama_upper}'")
+                        pos, score = matcher.match(nama)
+                        if pos is not None:
+                            fuzzy_found += 1
+                            print(f"FUZZY MATCH: '{nama}' ~ '{lookup_names[pos]}' (score {score:.2f}) -> '{lookup[lookup_names[pos]]}'")
+                        else:
+                            print(f"NO MATCH: '{nama}' -> '{nama_upper}' (best score {score:.2f})")
             
             print(f"\nSiang Session Results:")
             print(f"Total students: {total_students}")
             print(f"Matches found: {matches_found}")
+            print(f"Fuzzy matches found: {fuzzy_found}")
             print(f"Match rate: {(matches_found/total_students*100):.1f}%" if total_students > 0 else "No students")
 
+def test_normalize_name_strips_titles_degrees_and_accents():
+    """Gelar depan, gelar di belakang koma, aksen dan tanda baca dibuang; hasil UPPERCASE"""
+    assert normalize_name("Dr. Ir. Budi Santoso, S.T., M.T.") == "BUDI SANTOSO"
+    assert normalize_name("Prof.Dr. H. Ahmad  Wijaya") == "AHMAD WIJAYA"
+    assert normalize_name("José Ñúñez-Pérez") == "JOSE NUNEZ PEREZ"
+    assert normalize_name("Siti Nur'aini") == "SITI NUR AINI"
+    # Gelar saja tidak dibuang habis
+    assert normalize_name("Dr") == "DR"
+    assert normalize_name(None) == ""
+    assert normalize_name("nan") == ""
+
+
+def test_number_tokens_must_match_exactly():
+    """Nama yang hanya beda angka bukan salah ketik"""
+    matcher = NameMatcher(["BUDI SANTOSO 2", "ANDI WIJAYA"], threshold=0.5)
+    assert matcher.match("Budi Santoso 2") == (0, 1.0)
+    assert matcher.match("Budi Santoso 3")[0] is None
+    assert matcher.match("Budi Santoso")[0] is None
+    assert matcher.match("Andi Wijaya 2")[0] is None
+
+
+def test_threshold_boundary_is_inclusive():
+    """Skor tepat sama dengan threshold masih cocok, sedikit di atasnya tidak"""
+    names = ["MUHAMMAD RIZKI PRATAMA"]
+    query = "MUHAMAD RIZKY PRATAMA"
+    pos, score = NameMatcher(names, threshold=0.01).match(query)
+    assert pos == 0 and 0 < score < 1
+    assert NameMatcher(names, threshold=score).match(query) == (0, score)
+    assert NameMatcher(names, threshold=min(1.0, score + 1e-6)).match(query)[0] is None
+
+
+def _brute_force_best(names, query, n=3):
+    """Skor Dice terbaik lewat scan semua nama (token angka harus sama), tanpa index."""
+    normalized = normalize_name(query)
+    grams = _ngrams(normalized, n)
+    numbers = {token for token in normalized.split() if token.isdigit()}
+    best = 0.0
+    for name in names:
+        candidate_name = normalize_name(name)
+        if not candidate_name or {t for t in candidate_name.split() if t.isdigit()} != numbers:
+            continue
+        candidate = _ngrams(candidate_name, n)
+        best = max(best, 2.0 * len(grams & candidate) / (len(grams) + len(candidate)))
+    return best
+
+
+def test_prefix_filter_matches_brute_force_scan():
+    """Blocking n-gram + prefix filtering tidak boleh melewatkan kandidat di atas threshold"""
+    rng = random.Random(20240917)
+    syllables = ['AN', 'DI', 'BU', 'SAN', 'TO', 'SO', 'RI', 'ZKI', 'PRA', 'TA', 'MA', 'WI', 'JA', 'YA',
+                 'NUR', 'SI', 'TI', 'DEWI', 'PUT', 'RA', 'HA', 'DI', 'KUS', 'UMA', 'LES']
+
+    def make_name():
+        words = [''.join(rng.choice(syllables) for _ in range(rng.randint(1, 3))) for _ in range(rng.randint(1, 4))]
+        if rng.random() < 0.1:
+            words.append(str(rng.randint(1, 3)))
+        return ' '.join(words)
+
+    def typo(name):
+        chars = list(name)
+        for _ in range(rng.randint(0, 3)):
+            i = rng.randrange(len(chars))
+            op = rng.random()
+            if op < 0.4:
+                chars[i] = rng.choice('ABDEIKNORSTUY')
+            elif op < 0.7 and len(chars) > 3:
+                del chars[i]
+            else:
+                chars.insert(i, rng.choice('AHIU'))
+        return ''.join(chars)
+
+    names = [make_name() for _ in range(400)]
+    queries = [typo(rng.choice(names)) for _ in range(300)] + [make_name() for _ in range(100)]
+    for threshold in (0.6, 0.75, 0.9):
+        matcher = NameMatcher(names, threshold=threshold)
+        for query in queries:
+            expected = _brute_force_best(names, query)
+            pos, score = matcher.match(query)
+            if expected >= threshold:
+                assert pos is not None, (query, threshold, expected)
+                assert abs(score - expected) < 1e-12, (query, threshold, score, expected)
+                assert abs(_brute_force_best([names[pos]], query) - score) < 1e-12
+            else:
+                assert pos is None, (query, threshold, score, expected)
+
+
 if __name__ == "__main__":
     test_name_matching()
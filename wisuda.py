@@ -0,0 +1,1669 @@
+import os
+import re
+import sys
+import json
+import argparse
+import cProfile
+import io
+import pstats
+import copy
+import hashlib
+import struct
+import numpy as np
+import pandas as pd
+import threading
+import logging
+import logging.handlers
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from PIL import Image, ImageOps
+from pptx import Presentation
+from pptx.util import Inches, Cm
+from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.shapes.picture import CT_Picture
+from pptx.parts.slide import SlideLayoutPart, SlidePart
+from pptx.oxml.slide import CT_Slide
+from pptx.opc.packuri import PackURI
+from excel_cache import read_excel_cached
+from name_matching import NameMatcher, normalize_name
+from stage_timer import StageTimer
+from streamed_media import StreamedMedia
+from build_journal import BuildJournal
+from pptx_writer import file_sha256, remove_stale_temp_files, save_presentation_atomic
+from layout_profile import available_profiles, load_profile
+
+logger = logging.getLogger('wisuda')
+
+# (level, log_file) terakhir dari setup_logging; dikirim ke worker process lewat initargs
+_log_settings = ('INFO', None)
+
+
+def setup_logging(level='INFO', log_file=None, append=False, buffer_capacity=1000):
+    """Konfigurasi logger 'wisuda': console (pesan saja) + opsional file log ber-buffer.
+
+    Default INFO hanya menampilkan ringkasan (deck tersimpan, sesi, total); DEBUG menambah
+    detail per slide. File log ditulis lewat MemoryHandler per `buffer_capacity` record,
+    ERROR langsung di-flush. Worker process memanggil ulang dengan append=True.
+    """
+    global _log_settings
+    _log_settings = (level, log_file)
+    logger.setLevel(getattr(logging, str(level).upper(), logging.INFO))
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        if append and isinstance(handler, logging.handlers.MemoryHandler):
+            # Worker hasil fork mewarisi salinan buffer proses utama; jangan ditulis dua kali
+            handler.buffer.clear()
+        else:
+            handler.flush()
+        handler.close()
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(console)
+
+    if log_file:
+        if not append:
+            open(log_file, 'w', encoding='utf-8').close()
+        # Selalu mode append (O_APPEND) supaya tulisan proses utama dan worker tidak saling timpa
+        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)-7s [%(processName)s] %(message)s'))
+        logger.addHandler(logging.handlers.MemoryHandler(
+            buffer_capacity, flushLevel=logging.ERROR, target=file_handler, flushOnClose=False))
+
+
+def flush_logging():
+    """Tulis isi buffer file log. Worker process keluar tanpa atexit, jadi dipanggil per deck."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
+def _worker_logging_initargs():
+    """initargs untuk ProcessPoolExecutor agar worker memakai level/file log yang sama."""
+    return (*_log_settings, True)
+
+
+# Generator di worker process deck; dikirim sekali per worker lewat initializer, bukan per job
+_worker_generator = None
+
+
+def _init_deck_worker(generator, *logging_args):
+    """Initializer worker deck: logging seperti proses utama dan simpan generator untuk semua job."""
+    global _worker_generator
+    setup_logging(*logging_args)
+    _worker_generator = generator
+
+
+def _build_deck_in_worker(job):
+    return _worker_generator.build_deck(job)
+
+# Karakter kontrol yang tidak boleh ada di XML (python-pptx biasanya meng-escape ini)
+_XML_ILLEGAL_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class PhotoIndex:
+    """Index foto wisuda: scan folder photos/ sekali, lookup NIM -> path tanpa akses disk.
+
+    Nama file dan folder dicocokkan tanpa membedakan huruf besar/kecil (*.JPG, folder program
+    dengan kapitalisasi lain), seperti os.path.exists di Windows/macOS/SMB dulu.
+    """
+    PHOTO_SUFFIX = '_graduation_1.jpg'
+
+    def __init__(self, root='photos'):
+        self.root = root
+        self.by_folder = {}  # (key folder program, key nim) -> path
+        self.by_nim = {}     # key nim -> path (untuk foto yang salah folder)
+        self.stats = {}      # path -> (size, mtime)
+        self.scan()
+
+    def scan(self):
+        """Walk root dengan os.scandir (rekursif) dan bangun ulang index."""
+        self.by_folder.clear()
+        self.by_nim.clear()
+        self.stats.clear()
+        if not os.path.isdir(self.root):
+            logger.warning(f"Warning: photo folder '{self.root}' not found")
+            return
+
+        stack = [self.root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.error(f"Error scanning {current}: {e}")
+                continue
+            folder = self.key(os.path.relpath(current, self.root))
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                    continue
+                name = self.key(entry.name)
+                if name.endswith(self.PHOTO_SUFFIX):
+                    nim = name[:-len(self.PHOTO_SUFFIX)]
+                    st = entry.stat()
+                    self.by_folder.setdefault((folder, nim), entry.path)
+                    self.by_nim.setdefault(nim, entry.path)
+                    self.stats[entry.path] = (st.st_size, st.st_mtime)
+
+        logger.info(f"Indexed {len(self.stats)} photos in '{self.root}'")
+
+    @staticmethod
+    def key(name):
+        """Bentuk nama file/folder untuk dibandingkan: path dinormalisasi, tanpa beda huruf besar/kecil."""
+        return os.path.normcase(os.path.normpath(name)).casefold()
+
+    def find(self, nim, program_folder):
+        """Path foto di folder program; kalau tidak ada, foto NIM yang sama di folder lain."""
+        nim = self.key(str(nim))
+        path = self.by_folder.get((self.key(str(program_folder)), nim))
+        if path:
+            return path
+        return self.by_nim.get(nim)
+
+
+# (path, mtime) -> (width, height)
+_image_size_cache = {}
+
+# Marker JPEG SOFn yang memuat ukuran frame (C4/C8/CC bukan SOF)
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def _read_image_header_size(path):
+    """Baca ukuran PNG/JPEG dari header saja; format lain lewat PIL (tetap tanpa decode)."""
+    with open(path, 'rb') as f:
+        head = f.read(24)
+        if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+            return struct.unpack('>II', head[16:24])
+        if head[:2] == b'\xff\xd8':
+            f.seek(2)
+            while True:
+                byte = f.read(1)
+                while byte and byte != b'\xff':
+                    byte = f.read(1)
+                while byte == b'\xff':
+                    byte = f.read(1)
+                if not byte:
+                    break
+                marker = byte[0]
+                if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                    continue  # marker tanpa segmen
+                if marker in (0xD9, 0xDA):
+                    break  # EOI / awal data scan tanpa SOF
+                segment = f.read(2)
+                if len(segment) < 2:
+                    break
+                length = struct.unpack('>H', segment)[0]
+                if marker in _JPEG_SOF_MARKERS:
+                    height, width = struct.unpack('>xHH', f.read(5))
+                    return width, height
+                f.seek(length - 2, 1)
+    with Image.open(path) as img:
+        return img.size
+
+
+def probe_image_size(path):
+    """Ukuran (width, height) gambar dalam pixel, di-memo per path + mtime."""
+    key = (path, os.stat(path).st_mtime)
+    size = _image_size_cache.get(key)
+    if size is None:
+        size = _image_size_cache[key] = tuple(_read_image_header_size(path))
+    return size
+
+
+def render_photo(src_path, dest_path, target_px, quality):
+    """Decode, orientasikan (EXIF), resize dan simpan foto sebagai JPEG. Dipakai juga oleh worker."""
+    with Image.open(src_path) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        img.thumbnail(target_px, Image.LANCZOS)  # tidak pernah memperbesar
+        # Tulis ke file sementara dulu agar proses lain tidak membaca file setengah jadi
+        tmp_path = f"{dest_path}.{os.getpid()}.tmp"
+        img.save(tmp_path, 'JPEG', quality=quality, optimize=True)
+    os.replace(tmp_path, dest_path)
+    return dest_path
+
+
+class PhotoCache:
+    """Cache foto yang sudah di-resize ke ukuran frame dan di-encode ulang sebagai JPEG."""
+
+    def __init__(self, cache_dir='.photo_cache', quality=85):
+        self.cache_dir = cache_dir
+        self.quality = quality
+        # Isi cache dibaca sekali; cek per foto tidak perlu os.path.exists
+        self._cached_names = set(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else set()
+
+    def cache_path(self, src_path, mtime, target_px):
+        """Nama file cache dari path sumber, mtime, ukuran target dan kualitas JPEG."""
+        key = f"{os.path.abspath(src_path)}|{mtime}|{target_px[0]}x{target_px[1]}|q{self.quality}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.jpg')
+
+    def get(self, src_path, target_px, mtime=None):
+        """Path JPEG hasil resize untuk src_path; diproses dan disimpan dulu kalau belum ada."""
+        if mtime is None:
+            mtime = os.stat(src_path).st_mtime
+        cached_path = self.cache_path(src_path, mtime, target_px)
+        if self.is_cached(cached_path):
+            return cached_path
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        render_photo(src_path, cached_path, target_px, self.quality)
+        self.mark_cached(cached_path)
+        return cached_path
+
+    def is_cached(self, cached_path):
+        """Cek file cache tanpa akses disk."""
+        return os.path.basename(cached_path) in self._cached_names
+
+    def mark_cached(self, cached_path):
+        """Catat file cache yang baru ditulis (mis. oleh worker process)."""
+        self._cached_names.add(os.path.basename(cached_path))
+
+
+
+class StudentRecord:
+    """Satu mahasiswa untuk slide builder, dibuat sekali per deck lewat itertuples (tanpa Series per baris).
+
+    Atribut teks sudah final seperti tampil di slide (lihat normalize_text_columns); diterima berisi
+    label "DITERIMA DI :" kalau ada perusahaan. program_folder = PROGRAM STUDI asli untuk mencari
+    foto, template = nama template predikat.
+    """
+    __slots__ = ('nim', 'program_folder', 'template', 'program', 'nama', 'ipk', 'tak',
+                 'diterima', 'perusahaan', 'dosen_wali', 'pembimbing')
+
+    # Field profil (text_fields) -> atribut
+    FIELD_ATTRS = {
+        'PROGRAM STUDI': 'program',
+        'NAMA MAHASISWA': 'nama',
+        'NIM': 'nim',
+        'IPK': 'ipk',
+        'SKOR TAK': 'tak',
+        'DITERIMA DI': 'diterima',
+        'PERUSAHAAN': 'perusahaan',
+        'Nama Dosen Wali': 'dosen_wali',
+        'DOSEN PEMBIMBING': 'pembimbing',
+    }
+    COLUMNS = [
+        'NIM', 'PROGRAM STUDI', 'PREDIKAT KELULUSAN', 'program_label', 'NAMA MAHASISWA', 'IPK', 'SKOR TAK',
+        'PERUSAHAAN', 'Nama Dosen Wali', 'DOSEN PEMBIMBING',
+    ]
+
+    @classmethod
+    def from_frame(cls, df, template_for):
+        """List StudentRecord untuk baris df (urutan sama); template_for(predikat) -> nama template."""
+        frame = df.reindex(columns=cls.COLUMNS, fill_value='')
+        for column in ('PROGRAM STUDI', 'PREDIKAT KELULUSAN'):
+            frame[column] = frame[column].astype(object).where(frame[column].notna(), '')
+        templates = {}  # predikat -> template, dihitung sekali per nilai
+        records = []
+        for nim, program_folder, predikat, program, nama, ipk, tak, perusahaan, wali, pembimbing in \
+                frame.itertuples(index=False, name=None):
+            record = cls()
+            record.nim = nim
+            record.program_folder = program_folder
+            template = templates.get(predikat)
+            if template is None:
+                template = templates[predikat] = template_for(predikat)
+            record.template = template
+            record.program = program
+            record.nama = nama
+            record.ipk = ipk
+            record.tak = tak
+            record.perusahaan = perusahaan
+            # PERUSAHAAN : Only show if company found in lookup
+            record.diterima = "DITERIMA DI :" if perusahaan else ''
+            record.dosen_wali = wali
+            record.pembimbing = pembimbing
+            records.append(record)
+        return records
+
+
+class DeckContext:
+    """State satu presentasi yang sedang dirakit: part latar, layout, prototype slide dan media foto.
+
+    Dibuat per deck (assemble_deck, test mode) dan dilepas bersama presentasinya. Cache ini tidak
+    boleh disimpan di generator: part-part-nya memegang package, jadi deck lama ikut tertahan di memori.
+    """
+    __slots__ = ('prs', 'package', 'background_parts', 'layouts', 'prototypes', 'media')
+
+    def __init__(self, prs):
+        self.prs = prs
+        self.package = prs.part.package
+        self.background_parts = {}  # template_path -> ImagePart
+        self.layouts = {}           # predikat -> SlideLayout
+        self.prototypes = {}        # predikat -> {'layout_part', 'sld'} (lihat _build_slide_prototype)
+        self.media = StreamedMedia(self.package)  # foto, di-stream dari disk saat save
+
+
+class GraduationPPTGenerator:
+    DPI = 96  # konsisten dengan PowerPoint
+
+    # LAYOUT - template, posisi frame foto, kotak teks dan grouping deck ada di profiles/<nama>.json
+    DEFAULT_PROFILE = 'revisi_pt_1'
+
+    # PRE-PROCESSING FOTO - foto di-resize ke ukuran frame sebelum di-embed
+    PHOTO_DPI = 200             # Resolusi foto di dalam frame (0/None = pakai foto asli)
+    PHOTO_JPEG_QUALITY = 85     # Kualitas JPEG hasil re-encode
+    PHOTO_CACHE_DIR = '.photo_cache'
+
+    # KOMPRESI FILE PPTX
+    PPTX_COMPRESSLEVEL = 6      # Level deflate part XML (1 = cepat, 9 = paling kecil, 0 = tanpa kompresi)
+    PPTX_STORE_MEDIA = True     # Foto/latar (JPEG/PNG) disimpan tanpa deflate ulang
+    SAVE_QUEUE_SIZE = 2         # Mode serial: deck selesai yang boleh antre di writer thread (0 = simpan langsung)
+
+    # INCREMENTAL BUILD - deck yang fingerprint-nya sama dengan run sebelumnya tidak dibangun ulang
+    BUILD_MANIFEST = '.build_manifest.json'  # di dalam folder output
+    BUILD_JOURNAL = '.build_journal.jsonl'   # checkpoint per deck selama run (lihat BuildJournal)
+    BUILD_MANIFEST_VERSION = 1  # naikkan kalau cara membangun slide berubah
+
+    # FORMAT TEKS - IPK/SKOR TAK numerik ditampilkan dengan format tetap (lihat normalize_text_columns)
+    NUMBER_FORMATS = {'IPK': '{:.2f}', 'SKOR TAK': '{:.0f}'}
+
+    # PENCOCOKAN NAMA - list_pekerjaan.xlsx
+    NAME_MATCH_THRESHOLD = 0.9  # Skor minimal fuzzy match (1.0 = hanya nama yang sama persis)
+
+    # FIELD TEKS (profile.text_fields) - jadi placeholder di slide layout per predikat
+    FIELD_PH_IDX_BASE = 10  # idx placeholder = base + urutan di profile.text_fields
+
+    # Kolom Excel yang dipakai (kolom lain tidak dibaca)
+    REQUIRED_COLUMNS = [
+        'PROGRAM STUDI', 'NAMA MAHASISWA', 'NIM', 'IPK', 'SKOR TAK',
+        'Nama Dosen Wali', 'Nama Dosen Pembimbing 1', 'Nama Dosen Pembimbing 2',
+        'PREDIKAT KELULUSAN', 'TEMPAT DUDUK', 'SESI'
+    ]
+
+    def __init__(self, photo_dpi=None, photo_jpeg_quality=None, name_match_threshold=None, timing_report=None,
+                 incremental=True, pptx_compresslevel=None, pptx_store_media=None, profile=None,
+                 save_queue_size=None, resume=False, verify_outputs=False):
+        # Waktu/jumlah panggilan/bytes per stage; timing_report = nama file JSON di folder output
+        self.timer = StageTimer()
+        self.timing_report = timing_report
+        self.incremental = incremental
+        self.resume = resume  # lanjutkan run yang terputus: deck yang tercatat selesai di journal dilewati
+        self.verify_outputs = verify_outputs  # hash ulang semua output sebelum dilewati (bukan hanya size/mtime)
+        self.pptx_compresslevel = self.PPTX_COMPRESSLEVEL if pptx_compresslevel is None else pptx_compresslevel
+        self.pptx_store_media = self.PPTX_STORE_MEDIA if pptx_store_media is None else pptx_store_media
+        self.save_queue_size = self.SAVE_QUEUE_SIZE if save_queue_size is None else save_queue_size
+        self.apply_profile(self.DEFAULT_PROFILE if profile is None else profile)
+        self.name_match_threshold = self.NAME_MATCH_THRESHOLD if name_match_threshold is None else name_match_threshold
+        # Dicek di sini: di dalam _load_company_lookup error NameMatcher akan dianggap "lookup gagal dibaca"
+        threshold = self.name_match_threshold
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or not 0 < threshold <= 1:
+            raise ValueError(f"NAME_MATCH_THRESHOLD must be a number in (0, 1], got {self.name_match_threshold!r}")
+        self.company_matcher = None  # NameMatcher atas kunci company_lookup
+        with self.timer.stage('company_lookup'):
+            self.company_lookup = self._load_company_lookup()
+        self.photo_index = None  # PhotoIndex, dibangun saat pertama dibutuhkan
+        self.photo_dpi = self.PHOTO_DPI if photo_dpi is None else photo_dpi
+        self.photo_cache = PhotoCache(
+            self.PHOTO_CACHE_DIR,
+            quality=self.PHOTO_JPEG_QUALITY if photo_jpeg_quality is None else photo_jpeg_quality,
+        )
+
+    def __getstate__(self):
+        # Lookup perusahaan tidak perlu di worker: PERUSAHAAN sudah jadi kolom sebelum deck dibangun.
+        state = self.__dict__.copy()
+        state['company_lookup'] = None
+        state['company_matcher'] = None
+        return state
+
+    def apply_profile(self, profile):
+        """Pakai LayoutProfile (atau nama profil / path JSON) untuk semua deck berikutnya."""
+        self.profile = load_profile(profile)
+        self.templates = self.profile.templates
+        # Atribut StudentRecord per placeholder (urutan profile.text_fields)
+        self._field_attrs = [StudentRecord.FIELD_ATTRS[field[0]] for field in self.profile.text_fields]
+
+    def for_profile(self, profile):
+        """Generator untuk profil lain yang berbagi timer, index foto dan cache foto dengan generator ini.
+
+        Lewat __getstate__ seperti ke worker: lookup perusahaan tidak ikut (kolom PERUSAHAAN sudah di-join sekali di process_graduation_data).
+        """
+        generator = copy.copy(self)
+        generator.apply_profile(profile)
+        return generator
+
+    # =========================
+    # Helpers ukuran & gambar
+    # =========================
+    def _set_slide_size_to_image_exact(self, prs, image_path, dpi=None):
+        """Sesuaikan ukuran slide PERSIS dengan ukuran gambar (pixel -> inch @DPI)."""
+        if dpi is None:
+            dpi = self.DPI
+        if not image_path:
+            return
+        try:
+            w_px, h_px = probe_image_size(image_path)
+        except OSError:
+            return
+        prs.slide_width  = Inches(w_px / dpi)
+        prs.slide_height = Inches(h_px / dpi)
+
+    def _get_background_part(self, deck, image_path):
+        """Image part template untuk satu presentasi; file dibaca dan di-hash sekali saja."""
+        parts = deck.background_parts
+        if image_path not in parts:
+            parts[image_path] = deck.package.get_or_add_image_part(image_path)
+        return parts[image_path]
+
+    def _get_predikat_layout(self, deck, predikat, template_path):
+        """Slide layout khusus per predikat, dibuat sekali per presentasi."""
+        layouts = deck.layouts
+        if predikat not in layouts:
+            layouts[predikat] = self._build_predikat_layout(deck, predikat, template_path)
+        return layouts[predikat]
+
+    def _build_predikat_layout(self, deck, predikat, template_path):
+        """Buat slide layout berisi latar template (0,0 ukuran native) + placeholder teks bergaya."""
+        prs = deck.prs
+        master_part = prs.slide_masters[0].part
+        package = master_part.package
+
+        placeholders = []
+        for i, (field, left, top, width, height, font_size, alignment) in enumerate(self.profile.text_fields):
+            placeholders.append(
+                f'<p:sp><p:nvSpPr><p:cNvPr id="{i + 3}" name="{field}"/>'
+                f'<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+                f'<p:nvPr><p:ph type="body" sz="quarter" idx="{self.FIELD_PH_IDX_BASE + i}"/></p:nvPr></p:nvSpPr>'
+                f'<p:spPr><a:xfrm><a:off x="{Cm(left)}" y="{Cm(top)}"/><a:ext cx="{Cm(width)}" cy="{Cm(height)}"/></a:xfrm></p:spPr>'
+                f'<p:txBody><a:bodyPr wrap="none" anchor="t"><a:spAutoFit/></a:bodyPr>'
+                f'<a:lstStyle><a:lvl1pPr marL="0" indent="0" algn="{PP_ALIGN.to_xml(alignment)}">'
+                f'<a:spcBef><a:spcPts val="0"/></a:spcBef><a:buNone/>'
+                f'<a:defRPr sz="{font_size * 100}" b="1"><a:solidFill><a:srgbClr val="000000"/></a:solidFill>'
+                f'<a:latin typeface="Arial"/></a:defRPr></a:lvl1pPr></a:lstStyle>'
+                f'<a:p><a:endParaRPr lang="en-US"/></a:p></p:txBody></p:sp>'
+            )
+        layout_xml = (
+            f'<p:sldLayout {nsdecls("a", "r", "p")} preserve="1" userDrawn="1">'
+            f'<p:cSld name="Wisuda {predikat}"><p:spTree>'
+            f'<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+            f'<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/>'
+            f'<a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>'
+            f'{"".join(placeholders)}'
+            f'</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sldLayout>'
+        )
+        partname = package.next_partname('/ppt/slideLayouts/slideLayout%d.xml')
+        layout_part = SlideLayoutPart(partname, CT.PML_SLIDE_LAYOUT, package, parse_xml(layout_xml))
+        layout_part.relate_to(master_part, RT.SLIDE_MASTER)
+
+        # Daftarkan layout di slide master (id unik, berbagi ruang id dengan sldMasterId)
+        rId = master_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+        used_ids = [int(e.get('id')) for e in master_part._element.xpath('./p:sldLayoutIdLst/p:sldLayoutId')]
+        used_ids += [int(e.get('id')) for e in prs.part._element.xpath('./p:sldMasterIdLst/p:sldMasterId')]
+        sldLayoutId = master_part._element.get_or_add_sldLayoutIdLst()._add_sldLayoutId(rId=rId)
+        sldLayoutId.set('id', str(max(used_ids) + 1))
+
+        # Latar: picture di (0,0) ukuran native, dibagi oleh semua slide dengan layout ini
+        if template_path and os.path.exists(template_path):
+            try:
+                image_part = self._get_background_part(deck, template_path)
+                pic_rId = layout_part.relate_to(image_part, RT.IMAGE)
+                cx, cy = image_part.scale(None, None)
+                pic = CT_Picture.new_pic(2, 'Background', os.path.basename(template_path), pic_rId, 0, 0, cx, cy)
+                layout_part._element.cSld.spTree.insert(2, pic)
+            except Exception as e:
+                logger.error(f"Error setting background image {template_path}: {e}")
+
+        return layout_part.slide_layout
+
+    def _get_slide_prototype(self, deck, predikat, template_path):
+        """Prototype slide per predikat, dibuat sekali per presentasi (lihat _build_slide_prototype)."""
+        prototypes = deck.prototypes
+        if predikat not in prototypes:
+            prototypes[predikat] = self._build_slide_prototype(deck, predikat, template_path)
+        return prototypes[predikat]
+
+    def _build_slide_prototype(self, deck, predikat, template_path):
+        """Bangun satu slide lengkap (placeholder layout + elemen foto) yang tidak ikut disimpan.
+
+        Part prototype tidak di-relate dari presentasi, jadi tidak ikut ditulis. Setiap slide
+        mahasiswa = deep copy elemen p:sld ini; teks dan foto diganti langsung di XML.
+        """
+        layout = self._get_predikat_layout(deck, predikat, template_path)
+        package = deck.package
+        prototype_part = SlidePart(PackURI('/ppt/slides/prototype.xml'), CT.PML_SLIDE, package, CT_Slide.new())
+        slide = prototype_part.slide
+        slide.shapes.clone_layout_placeholders(layout)
+        for sp in slide.shapes._spTree.iterchildren(qn('p:sp')):
+            sp.get_or_add_txBody().p_lst[0].add_r()
+        # Foto selalu elemen terakhir (di atas teks), sama seperti add_picture setelah clone placeholder
+        shape_id = slide.shapes._next_shape_id
+        slide.shapes._spTree.append(CT_Picture.new_pic(shape_id, f'Picture {shape_id - 1}', '', 'rId0', 0, 0, 0, 0))
+        return {'layout_part': layout.part, 'sld': prototype_part._element}
+
+    def _clone_slide(self, deck, prototype):
+        """Tambahkan slide baru hasil deep copy prototype (setara prs.slides.add_slide + clone placeholder)."""
+        prs_part = deck.prs.part
+        slide_part = SlidePart(prs_part._next_slide_partname, CT.PML_SLIDE, prs_part.package,
+                               copy.deepcopy(prototype['sld']))
+        slide_part.relate_to(prototype['layout_part'], RT.SLIDE_LAYOUT)
+        rId = prs_part.relate_to(slide_part, RT.SLIDE)
+        prs_part._element.get_or_add_sldIdLst().add_sldId(rId)
+        return slide_part.slide
+
+    def _photo_target_px(self):
+        """Ukuran frame foto dalam pixel pada photo_dpi."""
+        return (
+            round(self.profile.photo_frame[2] / 2.54 * self.photo_dpi),
+            round(self.profile.photo_frame[3] / 2.54 * self.photo_dpi),
+        )
+
+    def prepare_photo(self, photo_path):
+        """Foto siap-embed: versi resize dari cache, atau file asli kalau resize dimatikan/gagal."""
+        if not self.photo_dpi:
+            return photo_path
+        stat = self.get_photo_index().stats.get(photo_path)
+        try:
+            return self.photo_cache.get(photo_path, self._photo_target_px(), mtime=stat[1] if stat else None)
+        except Exception as e:
+            logger.error(f"Error preprocessing photo {photo_path}: {e}")
+            return photo_path
+
+    def preprocess_photos(self, photo_paths, max_workers=None):
+        """Resize semua foto yang belum ada di cache secara paralel, sebelum deck dirakit.
+
+        max_workers: jumlah proses (default jumlah core CPU), tidak bergantung pada mode PARALLEL deck.
+        """
+        if not self.photo_dpi:
+            return
+        target_px = self._photo_target_px()
+        stats = self.get_photo_index().stats
+        pending = {}  # cached_path -> src_path
+        for path in set(photo_paths):
+            mtime = stats[path][1] if path in stats else os.stat(path).st_mtime
+            cached_path = self.photo_cache.cache_path(path, mtime, target_px)
+            if not self.photo_cache.is_cached(cached_path):
+                pending[cached_path] = path
+        if not pending:
+            return
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(pending)))
+        os.makedirs(self.photo_cache.cache_dir, exist_ok=True)
+        if max_workers == 1:
+            # Satu proses worker hanya menambah biaya start; resize langsung di sini
+            for dest, src in pending.items():
+                try:
+                    render_photo(src, dest, target_px, self.photo_cache.quality)
+                    self.photo_cache.mark_cached(dest)
+                except Exception as e:
+                    logger.error(f"Error preprocessing photo {src}: {e}")
+            return
+
+        logger.info(f"\nPreprocessing {len(pending)} photos on {max_workers} worker processes...")
+        flush_logging()  # sebelum fork, supaya buffer log tidak ikut tersalin ke worker
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=setup_logging,
+                                 initargs=_worker_logging_initargs()) as executor:
+            futures = {
+                executor.submit(render_photo, src, dest, target_px, self.photo_cache.quality): dest
+                for dest, src in pending.items()
+            }
+            for future in as_completed(futures):
+                dest = futures[future]
+                try:
+                    future.result()
+                    self.photo_cache.mark_cached(dest)
+                except Exception as e:
+                    # Dicoba lagi (atau pakai foto asli) saat slide dibuat
+                    logger.error(f"Error preprocessing photo {pending[dest]}: {e}")
+
+    def _add_picture_fit(self, deck, slide, pic, image_path, left, top, frame_width, frame_height):
+        """Isi elemen foto prototype (p:pic) agar gambar pas di dalam frame tanpa distorsi (centered)."""
+        try:
+            img_w, img_h = probe_image_size(image_path)
+        except Exception as e:
+            logger.error(f"Error opening image {image_path}: {e}")
+            return None
+
+        frame_ratio = float(frame_width) / float(frame_height) if frame_height else 1.0
+        img_ratio = img_w / img_h if img_h else 1.0
+
+        if img_ratio > frame_ratio:
+            width = int(frame_width)
+            height = int(width / img_ratio)
+        else:
+            height = int(frame_height)
+            width = int(height * img_ratio)
+
+        int_left = int(left)
+        int_top = int(top)
+        int_fw = int(frame_width)
+        int_fh = int(frame_height)
+        offset_left = int_left + (int_fw - int(width)) // 2
+        offset_top = int_top + (int_fh - int(height)) // 2
+
+        try:
+            with self.timer.stage('add_picture'):
+                image_part = deck.media.get_part(image_path)
+                pic.blipFill.blip.rEmbed = slide.part.relate_to(image_part, RT.IMAGE)
+                pic.nvPicPr.cNvPr.set('descr', image_part.desc)
+                pic.x, pic.y = int(offset_left), int(offset_top)
+                pic.cx, pic.cy = int(width), int(height)
+            self.timer.add_bytes('add_picture', os.path.getsize(image_path))
+            return pic
+        except Exception as e:
+            logger.error(f"Error adding fitted picture {image_path}: {e}")
+            return None
+
+    # =========================
+    # Data helpers
+    # =========================
+    def _load_company_lookup(self):
+        """Load company lookup from list_pekerjaan.xlsx file."""
+        try:
+            if os.path.exists('list_pekerjaan.xlsx'):
+                df = read_excel_cached('list_pekerjaan.xlsx', columns=['Nama', 'Nama Perusahaan'])
+                logger.info(f"Successfully read list_pekerjaan.xlsx with {len(df)} rows")
+                logger.debug(f"Columns in list_pekerjaan.xlsx: {list(df.columns)}")
+                
+                # Create lookup Series: nama_key (uppercase) -> nama_perusahaan
+                nama = self._clean_text_column(df.get('Nama', pd.Series(index=df.index, dtype=object)))
+                perusahaan = self._clean_text_column(df.get('Nama Perusahaan', pd.Series(index=df.index, dtype=object)))
+                valid = (nama != '') & (perusahaan != '')
+                lookup = pd.Series(perusahaan[valid].values, index=self._name_key(nama[valid]).values)
+                # Nama ganda: entri terakhir yang dipakai (sama seperti dict)
+                lookup = lookup[~lookup.index.duplicated(keep='last')]
+                # Index n-gram untuk nama yang tidak cocok persis
+                self.company_matcher = NameMatcher(lookup.index, threshold=self.name_match_threshold)
+                
+                logger.info(f"Loaded {len(lookup)} company entries from list_pekerjaan.xlsx")
+                logger.debug(f"Sample lookup entries: {lookup.head(3).to_dict()}")
+                return lookup
+            else:
+                logger.warning("Warning: list_pekerjaan.xlsx not found")
+                return pd.Series(dtype=object)
+        except Exception as e:
+            logger.error(f"Error loading company lookup: {e}")
+            return pd.Series(dtype=object)
+
+    @staticmethod
+    def _clean_text_column(series):
+        """NaN / 'nan' jadi string kosong, spasi di ujung dibuang."""
+        text = series.astype(object).where(series.notna(), '').astype(str).str.strip()
+        return text.mask(text.str.lower() == 'nan', '')
+
+    @classmethod
+    def _display_text(cls, series):
+        """Teks tampil: seperti _clean_text_column, plus spasi berulang jadi satu, UPPERCASE, tanpa karakter ilegal XML."""
+        text = series.astype(object).where(series.notna(), '').astype(str)
+        text = text.str.replace(_XML_ILLEGAL_CHARS, '', regex=True).str.replace(r'\s+', ' ', regex=True)
+        return cls._clean_text_column(text).str.upper()
+
+    def normalize_text_columns(self, df):
+        """Siapkan semua teks slide sekali untuk seluruh cohort (vectorized), sebelum deck dibangun.
+
+        Kolom field teks diganti string final (_display_text); IPK/SKOR TAK yang numerik diformat
+        dengan NUMBER_FORMATS, NIM numerik tanpa '.0'. Kolom baru: program_label (PROGRAM STUDI
+        untuk tampil; kolom aslinya tetap untuk grouping dan folder foto) dan DOSEN PEMBIMBING
+        (satu baris per dosen). Kolom yang tidak ada diisi string kosong.
+        """
+        def column(name):
+            return df[name] if name in df.columns else pd.Series('', index=df.index, dtype=object)
+
+        nim = column('NIM')
+        if nim.dtype.kind == 'f' and (nim.dropna() % 1 == 0).all():
+            nim = nim.astype('Int64')  # NIM jadi float kalau ada sel kosong
+        df['NIM'] = self._clean_text_column(nim)
+
+        for name in ('NAMA MAHASISWA', 'Nama Dosen Wali', 'PERUSAHAAN'):
+            df[name] = self._display_text(column(name))
+        df['program_label'] = self._display_text(column('PROGRAM STUDI'))
+
+        for name, number_format in self.NUMBER_FORMATS.items():
+            text = self._display_text(column(name))
+            numbers = pd.to_numeric(column(name), errors='coerce')
+            df[name] = numbers.map(number_format.format, na_action='ignore').where(numbers.notna(), text)
+
+        pembimbing1 = self._display_text(column('Nama Dosen Pembimbing 1'))
+        pembimbing2 = self._display_text(column('Nama Dosen Pembimbing 2'))
+        both = (pembimbing1 != '') & (pembimbing2 != '')
+        df['DOSEN PEMBIMBING'] = (pembimbing1 + '\n' + pembimbing2).where(both, pembimbing1 + pembimbing2)
+        return df
+
+    @staticmethod
+    def _name_key(names):
+        """Kunci pencocokan nama (lihat normalize_name: tanpa gelar, tanda baca, aksen; UPPERCASE)."""
+        return names.map(normalize_name)
+
+    def add_company_column(self, df):
+        """Isi kolom PERUSAHAAN dengan satu join vectorized NAMA MAHASISWA -> list_pekerjaan.
+
+        Nama yang tidak cocok persis dicari lewat fuzzy match (company_matcher). Skor kecocokan
+        disimpan di PERUSAHAAN_MATCH_SCORE (1.0 = sama persis setelah normalisasi). Nilai
+        PERUSAHAAN yang sudah ada di data dipakai kalau nama tidak ditemukan di lookup.
+        """
+        keys = self._name_key(self._clean_text_column(df['NAMA MAHASISWA']))
+        matched = keys.map(self.company_lookup)
+        scores = pd.Series(1.0, index=df.index).where(matched.notna())
+        exact_count = int(matched.notna().sum())
+
+        fuzzy_count = 0
+        if self.company_matcher is not None:
+            unmatched = matched.isna() & (keys != '')
+            for idx, key in keys[unmatched].items():
+                pos, score = self.company_matcher.match(key)
+                if pos is None:
+                    continue
+                matched[idx] = self.company_lookup.iloc[pos]
+                scores[idx] = score
+                fuzzy_count += 1
+                logger.debug(f"Fuzzy company match: '{df.at[idx, 'NAMA MAHASISWA']}' ~ '{self.company_lookup.index[pos]}' "
+                      f"(score {score:.2f}) -> {matched[idx]}")
+
+        if 'PERUSAHAAN' in df.columns:
+            matched = matched.fillna(df['PERUSAHAAN'])
+        df['PERUSAHAAN'] = matched
+        df['PERUSAHAAN_MATCH_SCORE'] = scores
+        logger.info(f"Company lookup: {exact_count + fuzzy_count}/{len(df)} students matched "
+              f"({exact_count} exact, {fuzzy_count} fuzzy >= {self.name_match_threshold})")
+        return df
+
+    def read_excel_data(self, file_path, columns=None):
+        """Read Excel file (only `columns` if given, cached per file version) and return DataFrame."""
+        try:
+            df = read_excel_cached(file_path, columns=columns)
+            logger.info(f"Successfully read {len(df)} rows from {file_path}")
+            logger.debug(f"Columns: {list(df.columns)}")
+            return df
+        except Exception as e:
+            logger.error(f"Error reading Excel file: {e}")
+            return None
+
+    def get_predikat_template(self, predikat):
+        """Determine template based on predikat kelulusan."""
+        if pd.isna(predikat) or predikat == '':
+            return 'Non Predikat'
+        predikat_str = str(predikat).lower().strip()
+        if 'summa' in predikat_str and 'cumlaude' in predikat_str:
+            return 'SUMMA CUMLAUDE'
+        elif 'cumlaude' in predikat_str and 'summa' not in predikat_str:
+            return 'CUMLAUDE'
+        else:
+            return 'Non Predikat'
+
+    def get_photo_index(self):
+        """PhotoIndex untuk folder photos/ (scan sekali per run)."""
+        if self.photo_index is None:
+            self.photo_index = PhotoIndex('photos')
+        return self.photo_index
+
+    def find_student_photo(self, nim, program_folder):
+        """Find student photo based on NIM in program folder."""
+        photo_path = self.get_photo_index().find(nim, program_folder)
+        expected_dir = PhotoIndex.key(os.path.join('photos', str(program_folder)))
+        if photo_path and PhotoIndex.key(os.path.dirname(photo_path)) != expected_dir:
+            logger.warning(f"Note: photo for NIM {nim} found outside '{program_folder}': {photo_path}")
+        return photo_path
+
+    # =========================
+    # Slide builders
+    # =========================
+    def create_slide(self, deck, student, photo_path):
+        """Create a single slide for a student (StudentRecord) in deck (DeckContext)."""
+        predikat = student.template
+        template_path = self.templates.get(predikat, self.templates['Non Predikat'])
+
+        # Latar ada di layout predikat; placeholder teks + elemen foto sudah ada di prototype
+        with self.timer.stage('add_slide'):
+            slide = self._clone_slide(deck, self._get_slide_prototype(deck, predikat, template_path))
+        pic = slide.shapes._spTree[-1]
+
+        # Posisi dan ukuran frame foto dalam CM
+        frame_left, frame_top, frame_w, frame_h = (Cm(v) for v in self.profile.photo_frame)
+
+        # FOTO: fit ke dalam frame merah (tengah); elemen foto dibuang kalau tidak ada foto
+        placed = None
+        if photo_path:
+            try:
+                with self.timer.stage('photo_prepare'):
+                    photo_path = self.prepare_photo(photo_path)
+                with self.timer.stage('photo_fit'):
+                    placed = self._add_picture_fit(deck, slide, pic, photo_path, frame_left, frame_top, frame_w, frame_h)
+            except Exception as e:
+                logger.error(f"Error adding photo {photo_path}: {e}")
+        if placed is None:
+            pic.getparent().remove(pic)
+
+        # Teks info mahasiswa & dosen
+        with self.timer.stage('text'):
+            self.add_student_info(slide, student)
+
+        return slide
+
+    def _fill_placeholders(self, slide, student):
+        """Isi placeholder teks dari prototype dengan atribut StudentRecord; yang kosong dihapus dari slide.
+
+        Teks diganti langsung di <a:t> run kosong milik prototype; tiap baris jadi satu paragraf.
+        """
+        spTree = slide.shapes._spTree
+        field_attrs = self._field_attrs
+        for sp in list(spTree.iterchildren(qn('p:sp'))):
+            text = getattr(student, field_attrs[int(sp.nvSpPr.nvPr.ph.get('idx')) - self.FIELD_PH_IDX_BASE])
+            if not text:
+                spTree.remove(sp)
+                continue
+            paragraph = sp.txBody.p_lst[0]
+            lines = text.split('\n')
+            paragraph.r_lst[0].t.text = lines[0]
+            for line in reversed(lines[1:]):
+                extra = copy.deepcopy(paragraph)
+                extra.r_lst[0].t.text = line
+                paragraph.addnext(extra)
+
+    def add_student_info(self, slide, student):
+        """Add student information to slide - POSISI SESUAI PROFIL (profile.text_fields)."""
+        self._fill_placeholders(slide, student)
+
+    def student_records(self, df):
+        """StudentRecord per baris df, dalam urutan yang sama."""
+        return StudentRecord.from_frame(df, self.get_predikat_template)
+
+    # =========================
+    # Pipeline
+    # =========================
+    def build_deck(self, job):
+        """Bangun dan simpan satu deck (summa atau duduk L/R). Aman dipanggil dari worker process."""
+        prs, result, timer = self.assemble_deck(job)
+        if prs is None:
+            return result
+        return self.save_deck(prs, job, result, timer)
+
+    def assemble_deck(self, job):
+        """Bangun semua slide satu deck tanpa menyimpan.
+
+        Return (prs, result, timer): timer = StageTimer khusus deck ini, result diisi save_deck.
+        Kalau gagal prs None dan result sudah final (error + timings).
+        """
+        students = job['students']
+        indent = job['indent']
+        # Timer khusus deck ini; hasilnya ikut dikembalikan (juga dari worker process)
+        run_timer, self.timer = self.timer, StageTimer()
+        timer = self.timer
+        result = {'output_file': job['output_file'], 'slides': 0, 'error': None}
+        try:
+            with timer.stage('records'):
+                records = self.student_records(students)
+            with timer.stage('deck_setup'):
+                prs = Presentation()
+                if records:
+                    first_template_path = self.templates.get(records[0].template, self.templates[job['default_template']])
+                else:
+                    first_template_path = self.templates[job['default_template']]
+                self._set_slide_size_to_image_exact(prs, first_template_path)
+                deck = DeckContext(prs)
+
+            # Detail per slide hanya dibentuk kalau level DEBUG aktif
+            verbose = logger.isEnabledFor(logging.DEBUG)
+
+            # Add slides
+            for student in records:
+                program = job['program'] if job['program'] is not None else student.program_folder
+                with timer.stage('find_photo'):
+                    photo_path = self.find_student_photo(student.nim, program)
+                if not photo_path:
+                    logger.warning(f"{indent}  Warning: Photo not found for {student.nama} (NIM: {student.nim})")
+                elif verbose:
+                    logger.debug(f"{indent}  Adding {job['slide_label']} for {student.nama} (NIM: {student.nim})")
+                with timer.stage('create_slide'):
+                    self.create_slide(deck, student, photo_path)
+            return prs, result, timer
+        except Exception as e:
+            logger.error(f"{indent}Error building {job['output_file']}: {e}")
+            result['error'] = str(e)
+            result['timings'] = timer.as_dict()
+            flush_logging()
+            return None, result, timer
+        finally:
+            self.timer = run_timer
+
+    def save_deck(self, prs, job, result, timer):
+        """Simpan deck dari assemble_deck dan lengkapi result (slides, error, timings).
+
+        Tidak memakai self.timer, jadi aman dijalankan di writer thread sementara deck lain dibangun.
+        """
+        indent = job['indent']
+        try:
+            with timer.stage('save'):
+                sha256, size = self.save_presentation(prs, job['output_file'])
+            timer.add_bytes('save', size)
+            logger.info(f"{indent}Saved: {job['output_file']} ({len(job['students'])} slides)")
+            result['slides'] = len(job['students'])
+            result['sha256'] = sha256
+            result['bytes'] = size
+            result['mtime_ns'] = os.stat(job['output_file']).st_mtime_ns
+        except Exception as e:
+            logger.error(f"{indent}Error saving {job['output_file']}: {e}")
+            result['error'] = str(e)
+        finally:
+            flush_logging()
+        result['timings'] = timer.as_dict()
+        return result
+
+    def plan_deck_jobs(self, df, output_dir):
+        """Pecah data menjadi job per deck sesuai profile.grouping dan siapkan folder output.
+
+        split_summa: summa satu sesi jadi <sesi>/summa/summa.pptx, sisanya per program.
+        split_sides: per program duduk_l.pptx dan duduk_r.pptx, kalau tidak satu file <program>.pptx.
+        sort_by_predikat: urut predikat lalu kursi, kalau tidak urut kursi saja.
+
+        Butuh kolom dari add_sort_columns. Data di-sort sekali lalu dipartisi dengan satu groupby;
+        tiap job hanya memuat baris miliknya, sudah dalam urutan slide.
+        """
+        jobs = []
+        grouping = self.profile.grouping
+        split_summa = grouping['split_summa']
+        split_sides = grouping['split_sides']
+
+        # Group by session
+        sessions = ['Pagi', 'Siang']
+        sides = ['L', 'R']
+
+        # Satu sort untuk semua deck: summa semuanya prioritas 1, jadi tetap urut per kursi
+        sort_columns = (['predikat_priority'] if grouping['sort_by_predikat'] else []) + self.SEAT_SORT_COLUMNS
+        ordered = df.sort_values(sort_columns, kind='stable')
+        keys = ['SESI', 'is_summa' if split_summa else None, 'PROGRAM STUDI', 'seat_side' if split_sides else None]
+        partitions = ordered.groupby(
+            [key for key in keys if key], sort=False, observed=True, dropna=False
+        ).indices
+
+        # Posisi baris (di `ordered`) per deck
+        summa_positions = {}  # sesi -> [positions per program]
+        side_positions = {}   # (sesi, program) -> {side: positions}; side None kalau tidak dipisah
+        for group, positions in partitions.items():
+            values = iter(group)
+            session, is_summa, program, side = (next(values) if key else None for key in keys)
+            if is_summa:
+                summa_positions.setdefault(session, []).append(positions)
+            else:
+                side_positions.setdefault((session, program), {})[side] = positions
+        session_counts = df['SESI'].value_counts()
+        
+        for session in sessions:
+            session_size = int(session_counts.get(session, 0))
+            if session_size == 0:
+                logger.info(f"\nNo data for session: {session}")
+                continue
+            
+            # Session folder name
+            session_folder_name = f"Wisuda {session}"
+            session_output_dir = os.path.join(output_dir, session_folder_name)
+            if not os.path.exists(session_output_dir):
+                os.makedirs(session_output_dir)
+            
+            logger.info(f"\nProcessing session: {session}")
+            
+            # 1. CREATE SUMMA FOLDER - All summa cumlaude students in one PPT
+            summa_size = 0
+            if session in summa_positions:
+                # Gabungan posisi yang di-sort = urutan kursi di `ordered`
+                summa_students = ordered.take(np.sort(np.concatenate(summa_positions[session])))
+                summa_size = len(summa_students)
+                logger.info(f"  Creating summa folder with {summa_size} students")
+                
+                # Create summa folder
+                summa_output_dir = os.path.join(session_output_dir, 'summa')
+                if not os.path.exists(summa_output_dir):
+                    os.makedirs(summa_output_dir)
+                
+                jobs.append({
+                    'students': summa_students,
+                    'program': None,  # foto dicari per program masing-masing mahasiswa
+                    'default_template': 'SUMMA CUMLAUDE',
+                    'slide_label': 'summa slide',
+                    'indent': '    ',
+                    'output_file': os.path.join(summa_output_dir, 'summa.pptx'),
+                })
+            elif split_summa:
+                logger.info(f"  No summa cumlaude students found in {session} session")
+            
+            # 2. CREATE PROGRAM FOLDERS - Exclude summa students
+            if session_size == summa_size:
+                logger.info(f"  No non-summa students found in {session} session")
+                continue
+            
+            # Iterate programs in this session (excluding summa students)
+            programs = [
+                program for (sesi, program) in side_positions
+                if sesi == session and pd.notna(program) and str(program).strip() != ''
+            ]
+            logger.info(f"  Processing {len(programs)} programs" + (" (excluding summa students)" if split_summa else ""))
+            
+            for program in programs:
+                positions_by_side = side_positions[(session, program)]
+                
+                safe_program_name = re.sub(r'[^\w\s-]', '', str(program)).strip()
+                safe_program_name = re.sub(r'[-\s]+', '_', safe_program_name)
+                prog_size = sum(len(positions) for positions in positions_by_side.values())
+                logger.info(f"    Program: {program} -> {prog_size} students" + (" (non-summa)" if split_summa else ""))
+
+                if not split_sides:
+                    # Satu file per program langsung di folder sesi
+                    jobs.append({
+                        'students': ordered.take(positions_by_side[None]),
+                        'program': program,
+                        'default_template': 'Non Predikat',
+                        'slide_label': 'slide',
+                        'indent': '    ',
+                        'output_file': os.path.join(session_output_dir, f"{safe_program_name}.pptx"),
+                    })
+                    continue
+
+                # Prepare program folder
+                program_output_dir = os.path.join(session_output_dir, safe_program_name)
+                if not os.path.exists(program_output_dir):
+                    os.makedirs(program_output_dir)
+                
+                # Produce two PPT files per program: L and R (sudah urut predikat lalu kursi)
+                for side in sides:
+                    if side not in positions_by_side:
+                        logger.debug(f"      Skip Duduk {side}: no students")
+                        continue
+                    side_data = ordered.take(positions_by_side[side])
+                    logger.debug(f"      Duduk {side}: {len(side_data)} students")
+                    
+                    jobs.append({
+                        'students': side_data,
+                        'program': program,
+                        'default_template': 'Non Predikat',
+                        'slide_label': 'slide',
+                        'indent': '      ',
+                        'output_file': os.path.join(program_output_dir, f"duduk_{side.lower()}.pptx"),
+                    })
+
+        return jobs
+
+    def run_deck_jobs(self, jobs, parallel=False, max_workers=None, on_result=None):
+        """Jalankan semua deck job, berurutan atau paralel di ProcessPoolExecutor.
+
+        on_result(job, result) dipanggil begitu satu deck selesai (di proses utama, bisa dari
+        writer thread), mis. untuk BuildJournal.
+        """
+        if on_result is None:
+            on_result = lambda job, result: None
+        if not parallel or len(jobs) <= 1:
+            if self.save_queue_size > 0 and len(jobs) > 1:
+                return self._run_deck_jobs_overlapped(jobs, on_result)
+            results = []
+            for job in jobs:
+                results.append(self.build_deck(job))
+                on_result(job, results[-1])
+            return results
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(jobs)))
+        logger.info(f"\nBuilding {len(jobs)} decks on {max_workers} worker processes...")
+
+        # Deck terbesar dulu agar beban antar worker lebih rata
+        ordered_jobs = sorted(jobs, key=lambda job: len(job['students']), reverse=True)
+        results = []
+        flush_logging()  # sebelum fork, supaya buffer log tidak ikut tersalin ke worker
+        # Generator (index foto, cache foto, ...) dikirim sekali per worker; per job hanya data deck
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_deck_worker,
+                                 initargs=(self, *_worker_logging_initargs())) as executor:
+            futures = {executor.submit(_build_deck_in_worker, job): job for job in ordered_jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # Worker mati / job tidak bisa di-pickle
+                    results.append({'output_file': job['output_file'], 'slides': 0, 'error': str(e), 'timings': {}})
+                on_result(job, results[-1])
+        return results
+
+    def _run_deck_jobs_overlapped(self, jobs, on_result):
+        """Bangun deck berurutan; file disimpan di writer thread sementara deck berikutnya dibangun.
+
+        Paling banyak save_queue_size deck selesai yang menunggu/sedang ditulis; kalau antrean
+        penuh, loop menunggu (backpressure, memori tetap terbatas). Error tulis tidak menghentikan
+        run: tercatat di result deck dan dilaporkan di ringkasan akhir generate_ppt_revisi.
+        """
+        slots = threading.BoundedSemaphore(self.save_queue_size)
+        results = []
+        pending = []  # (future, result)
+
+        def save(prs, job, result, timer):
+            self.save_deck(prs, job, result, timer)
+            on_result(job, result)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='deck-writer') as writer:
+            for job in jobs:
+                prs, result, timer = self.assemble_deck(job)
+                results.append(result)
+                if prs is None:
+                    on_result(job, result)
+                    continue
+                slots.acquire()
+                future = writer.submit(save, prs, job, result, timer)
+                future.add_done_callback(lambda _: slots.release())
+                pending.append((future, result))
+                del prs
+        for future, result in pending:
+            # save_deck menangkap error simpan sendiri; ini hanya untuk error tak terduga di thread
+            error = future.exception()
+            if error is not None:
+                result['error'] = str(error)
+                result.setdefault('timings', {})
+        return results
+
+    def save_presentation(self, prs, output_file):
+        """prs.save dengan pengaturan kompresi generator, atomic (lihat pptx_writer.save_presentation_atomic).
+
+        Return (sha256, bytes) file yang tersimpan.
+        """
+        return save_presentation_atomic(prs, output_file, compresslevel=self.pptx_compresslevel,
+                                        store_media=self.pptx_store_media)
+
+    def job_photo_paths(self, job):
+        """Path foto (atau None) tiap mahasiswa di job, urut sesuai job['students']."""
+        students = job['students']
+        photo_index = self.get_photo_index()
+        if job['program'] is not None:
+            programs = [job['program']] * len(students)
+        else:
+            programs = students['PROGRAM STUDI']
+        return [photo_index.find(nim, program) for nim, program in zip(students['NIM'], programs)]
+
+    def _layout_fingerprint(self):
+        """Hash template (isi via size+mtime) dan konstanta layout yang memengaruhi slide."""
+        parts = [self.BUILD_MANIFEST_VERSION, self.DPI, self.profile.photo_frame, self.photo_dpi,
+                 self.photo_cache.quality, self.pptx_compresslevel, self.pptx_store_media,
+                 self.FIELD_PH_IDX_BASE, self.profile.text_fields, self.profile.grouping]
+        for name, path in sorted(self.templates.items()):
+            try:
+                st = os.stat(path)
+                parts.append((name, path, st.st_size, st.st_mtime))
+            except OSError:
+                parts.append((name, path, None))
+        return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+    def deck_fingerprint(self, job, layout_fingerprint, photo_paths):
+        """Fingerprint satu deck: isi baris mahasiswa, size/mtime foto, template dan layout."""
+        digest = hashlib.sha256(layout_fingerprint.encode('ascii'))
+        students = job['students']
+        digest.update(repr(list(students.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(students, index=False).values.tobytes())
+        stats = self.get_photo_index().stats
+        for path in photo_paths:
+            digest.update(repr((path, stats.get(path))).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_build_manifest(self, output_dir):
+        manifest_file = os.path.join(output_dir, self.BUILD_MANIFEST)
+        if not os.path.exists(manifest_file):
+            return {}
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('decks', {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable build manifest {manifest_file}: {e}")
+            return {}
+
+    def _save_build_manifest(self, output_dir, decks):
+        manifest_file = os.path.join(output_dir, self.BUILD_MANIFEST)
+        tmp_file = manifest_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.BUILD_MANIFEST_VERSION, 'decks': decks}, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, manifest_file)
+
+    @staticmethod
+    def _manifest_entry(fingerprint, result):
+        """Entry manifest satu deck dari result build_deck/save_deck (atau entri journal)."""
+        return {'fingerprint': fingerprint, 'slides': result.get('slides'), 'sha256': result.get('sha256'),
+                'size': result.get('bytes'), 'mtime_ns': result.get('mtime_ns')}
+
+    def _check_output(self, entry, output_file):
+        """Entry manifest yang masih berlaku untuk output_file (size/mtime diperbarui), atau None.
+
+        Size dan mtime sama dengan manifest -> dipercaya tanpa membaca file (murah di USB/share
+        jaringan); size beda -> berubah. Selain itu (mis. mtime berubah karena disalin, entry
+        lama tanpa size, atau verify_outputs) SHA-256 file dihitung ulang.
+        """
+        if not entry.get('sha256'):
+            return None
+        try:
+            st = os.stat(output_file)
+        except OSError:
+            return None
+        if entry.get('size') is not None and st.st_size != entry['size']:
+            return None
+        if not self.verify_outputs and entry.get('size') is not None and entry.get('mtime_ns') == st.st_mtime_ns:
+            return entry
+        try:
+            if file_sha256(output_file) != entry['sha256']:
+                return None
+        except OSError:
+            return None
+        return dict(entry, size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+    def filter_unchanged_jobs(self, jobs, output_dir, manifest):
+        """Pisahkan job yang perlu dibangun dari deck yang tidak berubah sejak run terakhir.
+
+        Mengisi job['fingerprint'] dan job['photo_paths']. Deck dilewati kalau fingerprint-nya
+        sama dengan manifest dan file output-nya masih utuh (lihat _check_output); entry manifest
+        deck itu diperbarui di tempat. Return (jobs_to_build, skipped_results).
+        """
+        layout_fingerprint = self._layout_fingerprint()
+        to_build, skipped = [], []
+        for job in jobs:
+            job['photo_paths'] = self.job_photo_paths(job)
+            job['fingerprint'] = self.deck_fingerprint(job, layout_fingerprint, job['photo_paths'])
+            key = os.path.relpath(job['output_file'], output_dir)
+            entry = manifest.get(key)
+            if entry and entry.get('fingerprint') == job['fingerprint']:
+                entry = self._check_output(entry, job['output_file'])
+            else:
+                entry = None
+            if entry:
+                manifest[key] = entry
+                skipped.append({'output_file': job['output_file'], 'slides': entry.get('slides', len(job['students'])),
+                                'sha256': entry['sha256'], 'error': None, 'skipped': True, 'timings': {}})
+            else:
+                to_build.append(job)
+        return to_build, skipped
+
+    # Urutan kursi (baris, nomor, sisi)
+    SEAT_SORT_COLUMNS = ['seat_row', 'seat_no', 'seat_sort_side']
+
+    def add_sort_columns(self, df):
+        """Parse TEMPAT DUDUK dan PREDIKAT KELULUSAN sekali (vectorized) untuk seluruh data.
+
+        TEMPAT DUDUK berformat '<baris>.<nomor>.<sisi>' (mis. '1.1.L'):
+          seat_row, seat_no, seat_sort_side - urutan kursi; kosong/tidak valid (baris atau nomor
+              bukan bilangan bulat dengan digit ASCII 0-9) -> (999, 999, 'Z'), jadi di akhir
+          seat_side - sisi (UPPERCASE) untuk file duduk_l/duduk_r, 'Z' kalau tidak ada bagian ketiga
+        PREDIKAT KELULUSAN:
+          predikat_priority - 1 summa cumlaude, 2 cumlaude, 3 lainnya/kosong
+          is_summa - predikat_priority == 1
+        """
+        seat = df['TEMPAT DUDUK'].astype(object).where(df['TEMPAT DUDUK'].notna(), '').astype(str)
+        position = seat.str.extract(r'^\s*([+-]?[0-9]+)\s*\.\s*([+-]?[0-9]+)\s*\.([^.]*)')
+        valid = position[0].notna()
+        df['seat_row'] = pd.to_numeric(position[0]).fillna(999).astype(int)
+        df['seat_no'] = pd.to_numeric(position[1]).fillna(999).astype(int)
+        df['seat_sort_side'] = position[2].str.upper().where(valid, 'Z')
+
+        side = seat.str.extract(r'^[^.]*\.[^.]*\.([^.]*)')[0]
+        df['seat_side'] = side.str.upper().fillna('Z').astype('category')
+
+        predikat = df['PREDIKAT KELULUSAN'].astype(object).where(df['PREDIKAT KELULUSAN'].notna(), '')
+        predikat = predikat.astype(str).str.lower().str.strip()
+        has_summa = predikat.str.contains('summa', regex=False)
+        has_cumlaude = predikat.str.contains('cumlaude', regex=False)
+        df['is_summa'] = has_summa & has_cumlaude
+        df['predikat_priority'] = 3
+        df.loc[has_cumlaude & ~has_summa, 'predikat_priority'] = 2
+        df.loc[df['is_summa'], 'predikat_priority'] = 1
+        return df
+
+    def generate_ppt_revisi(self, df, output_dir=None, test_mode=False, parallel=False, max_workers=None):
+        """Generate PPT files separated by session (grouping sesuai profil) ke output_dir profil.
+
+        Teks harus sudah dinormalisasi dan kolom PERUSAHAAN disiapkan (normalize_text_columns,
+        company_column), seperti di process_graduation_data.
+        """
+        if output_dir is None:
+            output_dir = self.profile.test_output_dir if test_mode else self.profile.output_dir
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        if test_mode:
+            # Test mode: generate single PPT with test data
+            logger.info("\nProcessing test data...")
+            program_data = df
+            
+            prs = Presentation()
+            
+            # Use Cumlaude template for testing
+            template_path = self.templates['CUMLAUDE']
+            self._set_slide_size_to_image_exact(prs, template_path)
+            
+            # Add single test slide
+            student = self.student_records(program_data.iloc[:1])[0]
+            photo_path = self.find_student_photo(student.nim, self.profile.test_program)
+            if photo_path:
+                logger.info(f"  Adding test slide for {student.nama} (NIM: {student.nim})")
+            else:
+                logger.warning(f"  Warning: Photo not found for test data (NIM: {student.nim})")
+            self.create_slide(DeckContext(prs), student, photo_path)
+            
+            # Save test file
+            output_file = os.path.join(output_dir, "TEST_POSITION.pptx")
+            self.save_presentation(prs, output_file)
+            logger.info(f"  Saved: {output_file} (1 test slide)")
+            return
+
+        # Sisa file temp dari run yang terputus (deck tujuannya tidak pernah tersentuh)
+        stale = remove_stale_temp_files(output_dir)
+        if stale:
+            logger.info(f"Removed {stale} unfinished temp files from an interrupted run")
+
+        # Index foto dibangun sekali di sini agar ikut terkirim ke worker process
+        with self.timer.stage('photo_index'):
+            self.get_photo_index()
+        with self.timer.stage('sort'):
+            df = self.add_sort_columns(df)
+        with self.timer.stage('plan'):
+            jobs = self.plan_deck_jobs(df, output_dir)
+
+        manifest = self._load_build_manifest(output_dir) if self.incremental or self.resume else {}
+        journal = BuildJournal(os.path.join(output_dir, self.BUILD_JOURNAL))
+        if self.resume:
+            # Deck yang selesai di run terputus belum masuk manifest; journal lebih baru
+            completed = {key: self._manifest_entry(entry.get('fingerprint'), entry)
+                         for key, entry in journal.load().items() if entry.get('status') == 'ok'}
+            logger.info(f"\nResuming: {len(completed)} decks recorded as completed in {journal.path}")
+            manifest = dict(manifest, **completed)
+        with self.timer.stage('fingerprint'):
+            jobs, skipped = self.filter_unchanged_jobs(jobs, output_dir, manifest)
+        if skipped:
+            logger.info(f"\nSkipping {len(skipped)} unchanged decks, rebuilding {len(jobs)}")
+
+        if self.photo_dpi:
+            # Tahap foto (decode/resize, berat di CPU) dulu di process pool, juga di mode serial;
+            # deck tinggal merakit dari cache (prepare_photo hanya cadangan kalau ada yang gagal)
+            photo_paths = [path for job in jobs for path in job['photo_paths'] if path]
+            with self.timer.stage('photo_preprocess'):
+                self.preprocess_photos(photo_paths, max_workers=max_workers)
+
+        def record(job, result):
+            try:
+                journal.record(os.path.relpath(job['output_file'], output_dir), job['fingerprint'], result)
+            except OSError as e:
+                logger.error(f"Error writing build journal: {e}")
+
+        with self.timer.stage('build_decks'), journal.open(resume=self.resume):
+            results = self.run_deck_jobs(jobs, parallel=parallel, max_workers=max_workers, on_result=record)
+        for r in results:
+            self.timer.merge(r['timings'], deck=r['output_file'])
+
+        # Manifest hanya berisi deck yang ada di rencana sekarang dan berhasil dibangun
+        fingerprints = {job['output_file']: job['fingerprint'] for job in jobs}
+        decks = {}
+        for r in skipped:
+            key = os.path.relpath(r['output_file'], output_dir)
+            decks[key] = manifest[key]
+        for r in results:
+            if not r['error']:
+                decks[os.path.relpath(r['output_file'], output_dir)] = self._manifest_entry(
+                    fingerprints[r['output_file']], r)
+        try:
+            self._save_build_manifest(output_dir, decks)
+        except OSError as e:
+            logger.error(f"Error writing build manifest: {e}")
+
+        failed = [r for r in results if r['error']]
+        total_slides = sum(r['slides'] for r in results)
+        logger.info(f"\nDecks built: {len(results) - len(failed)}/{len(results)} ({total_slides} slides)"
+                    + (f", {len(skipped)} unchanged skipped" if skipped else ""))
+        results = skipped + results
+        for r in failed:
+            logger.error(f"  FAILED: {r['output_file']}: {r['error']}")
+        # Dari timing deck run ini saja; timer run bisa berisi deck profil lain
+        save_stats = [r['timings']['save'] for r in results if 'save' in r['timings']]
+        if save_stats:
+            logger.info(f"Save: {sum(t['seconds'] for t in save_stats):.2f} s "
+                        f"for {sum(t['bytes'] for t in save_stats) / 1e6:.1f} MB "
+                        f"(compresslevel={self.pptx_compresslevel}, media {'stored' if self.pptx_store_media else 'deflated'})")
+        return results
+
+    def create_test_data(self):
+        """Create random test data for testing textbox positions."""
+        test_data = {
+            'PROGRAM STUDI': 'S1 Rekayasa Perangkat Lunak',
+            'NAMA MAHASISWA': 'JOHN DOE TESTING DAN TESTING',
+            'NIM': '1201200001',
+            'IPK': '3.85',
+            'SKOR TAK': '450',
+            'Nama Dosen Wali': 'Dr. Ahmad Wijaya, S.T., M.T.',
+            'Nama Dosen Pembimbing 1': 'Prof. Dr. Budi Santoso, S.T., M.T.',
+            'Nama Dosen Pembimbing 2': 'Dr. Citra Dewi, S.T., M.Kom.',
+            'PREDIKAT KELULUSAN': 'Cumlaude',
+            'TEMPAT DUDUK': '1.1.L',
+            'SESI': 'Pagi',
+            'PERUSAHAAN': 'PT. Mencari Cinta Sejati'
+        }
+        return pd.DataFrame([test_data])
+
+    def read_combined_data(self):
+        """Read and combine data from both pagi and siang Excel files."""
+        combined_data = []
+        
+        # Read pagi data
+        if os.path.exists('wisuda_pagi.xlsx'):
+            logger.info("Reading wisuda_pagi.xlsx...")
+            df_pagi = self.read_excel_data('wisuda_pagi.xlsx', columns=self.REQUIRED_COLUMNS)
+            if df_pagi is not None:
+                df_pagi['SESI'] = 'Pagi'
+                combined_data.append(df_pagi)
+                logger.info(f"  Found {len(df_pagi)} students in Pagi session")
+        else:
+            logger.warning("Warning: wisuda_pagi.xlsx not found")
+        
+        # Read siang data
+        if os.path.exists('wisuda_siang.xlsx'):
+            logger.info("Reading wisuda_siang.xlsx...")
+            df_siang = self.read_excel_data('wisuda_siang.xlsx', columns=self.REQUIRED_COLUMNS)
+            if df_siang is not None:
+                df_siang['SESI'] = 'Siang'
+                combined_data.append(df_siang)
+                logger.info(f"  Found {len(df_siang)} students in Siang session")
+        else:
+            logger.warning("Warning: wisuda_siang.xlsx not found")
+        
+        if not combined_data:
+            logger.error("Error: No data found in both Excel files")
+            return None
+        
+        # Combine all data
+        df_combined = pd.concat(combined_data, ignore_index=True)
+        logger.info(f"\nTotal combined data: {len(df_combined)} students")
+        return df_combined
+
+    def company_column(self, df):
+        """Kolom PERUSAHAAN sesuai profile.company, dari cohort yang sudah di-normalisasi.
+
+        "lookup": kolom hasil add_company_column apa adanya, {"text": ...}: teks yang sama untuk
+        semua mahasiswa, null: kolom tidak dipakai dan dibuang.
+        """
+        if self.profile.company == 'lookup':
+            return df
+        if self.profile.fixed_company is not None:
+            return df.assign(PERUSAHAAN=self._display_text(pd.Series([self.profile.fixed_company])).iat[0])
+        return df.drop(columns=['PERUSAHAAN'], errors='ignore')
+
+    def process_graduation_data(self, output_dir=None, test_mode=False, parallel=False, max_workers=None, profiles=None):
+        """Main function to process graduation data.
+
+        profiles: profil layout yang dirender dari data yang sama (default: profil generator ini).
+        Excel dibaca sekali, join perusahaan dihitung sekali, index foto dan cache foto (termasuk
+        hasil resize) dipakai bersama oleh semua profil. output_dir: untuk satu profil menggantikan
+        folder output profil, untuk beberapa profil jadi folder induk <output_dir>/<nama profil>.
+        """
+        profiles = [self.profile] if not profiles else [load_profile(profile) for profile in profiles]
+        output_dirs = []
+        for profile in profiles:
+            if output_dir is None:
+                output_dirs.append(profile.test_output_dir if test_mode else profile.output_dir)
+            elif len(profiles) == 1:
+                output_dirs.append(output_dir)
+            else:
+                output_dirs.append(os.path.join(output_dir, profile.name))
+        duplicates = sorted({d for d in output_dirs if output_dirs.count(d) > 1})
+        if duplicates:
+            raise ValueError(f"Layout profiles write to the same output folder: {', '.join(duplicates)}")
+
+        if test_mode:
+            logger.info("=== TEST MODE: Generating single PPT with random data ===")
+            df = self.create_test_data()
+            logger.info("Using test data for textbox position testing")
+        else:
+            logger.info("Processing graduation data from Excel files...")
+            with self.timer.stage('read_excel'):
+                df = self.read_combined_data()
+            if df is None:
+                return
+
+            missing = [c for c in self.REQUIRED_COLUMNS if c not in df.columns]
+            if missing:
+                logger.warning(f"Warning: Missing columns: {missing}")
+                logger.warning(f"Available columns: {list(df.columns)}")
+
+            if 'PREDIKAT KELULUSAN' in df.columns:
+                logger.info("\nPredikat distribution:")
+                counts = df['PREDIKAT KELULUSAN'].value_counts()
+                for p, c in counts.items():
+                    t = self.get_predikat_template(p)
+                    logger.info(f"  {p}: {c} students -> {t} template")
+
+        # Join perusahaan (lookup + fuzzy match) sekali untuk semua profil yang memakainya,
+        # lalu semua teks slide dinormalisasi sekali untuk seluruh cohort
+        if any(profile.company == 'lookup' for profile in profiles):
+            with self.timer.stage('company_column'):
+                df = self.add_company_column(df.copy())
+        with self.timer.stage('normalize'):
+            df = self.normalize_text_columns(df)
+
+        # Index foto dibangun sebelum generator per profil dibuat supaya ikut terbagi
+        with self.timer.stage('photo_index'):
+            self.get_photo_index()
+        generators = [self if profile is self.profile else self.for_profile(profile) for profile in profiles]
+
+        for generator, profile_output_dir in zip(generators, output_dirs):
+            if len(generators) > 1:
+                logger.info(f"\n{'='*50}\nLayout: {generator.profile.name} -> {profile_output_dir}\n{'='*50}")
+            with self.timer.stage('generate'):
+                generator.generate_ppt_revisi(generator.company_column(df), profile_output_dir, test_mode,
+                                              parallel=parallel, max_workers=max_workers)
+        # Satu laporan untuk seluruh run: di folder output, atau folder induk bersama kalau beberapa profil
+        report_dir = output_dirs[0] if len(output_dirs) == 1 else os.path.commonpath(output_dirs) or '.'
+        self.report_timings(report_dir)
+            
+        if test_mode:
+            logger.info(f"\nTest PPT generated! Check the {', '.join(repr(d) for d in output_dirs)} folder for 'TEST_POSITION.pptx'")
+        else:
+            logger.info(f"\nProcessing completed! Check the {', '.join(repr(d) for d in output_dirs)} folder for generated PPT files.")
+
+    def report_timings(self, output_dir):
+        """Log tabel ringkasan stage dan tulis laporan JSON (kalau timing_report diisi)."""
+        logger.info(f"\nStage timings:\n{self.timer.summary_table()}")
+        if self.timing_report:
+            report_file = os.path.join(output_dir, self.timing_report)
+            try:
+                self.timer.write_json(report_file)
+                logger.info(f"Timing report: {report_file}")
+            except OSError as e:
+                logger.error(f"Error writing timing report {report_file}: {e}")
+
+def load_config():
+    """Load configuration from config.json file."""
+    config_file = 'config.json'
+    default_config = {
+        "TEST_MODE": False,
+        "PARALLEL": False,
+        "MAX_WORKERS": None,
+        "PHOTO_DPI": GraduationPPTGenerator.PHOTO_DPI,
+        "PHOTO_JPEG_QUALITY": GraduationPPTGenerator.PHOTO_JPEG_QUALITY,
+        "NAME_MATCH_THRESHOLD": GraduationPPTGenerator.NAME_MATCH_THRESHOLD,
+        "LOG_LEVEL": "INFO",
+        "LOG_FILE": None,
+        "TIMING_REPORT": "timing_report.json",
+        "INCREMENTAL": True,
+        "PPTX_COMPRESSLEVEL": GraduationPPTGenerator.PPTX_COMPRESSLEVEL,
+        "PPTX_STORE_MEDIA": GraduationPPTGenerator.PPTX_STORE_MEDIA,
+        "SAVE_QUEUE_SIZE": GraduationPPTGenerator.SAVE_QUEUE_SIZE,
+        "RESUME": False,
+        "VERIFY_OUTPUTS": False,
+        "LAYOUTS": [GraduationPPTGenerator.DEFAULT_PROFILE],
+    }
+    
+    try:
+        if os.path.exists(config_file):
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+                return config
+        else:
+            # Create default config file if it doesn't exist
+            with open(config_file, 'w', encoding='utf-8') as f:
+                json.dump(default_config, f, indent=4)
+                print(f"Created default config file: {config_file}")
+            return default_config
+    except Exception as e:
+        print(f"Error loading config: {e}. Using default settings.")
+        return default_config
+
+def run(config, layouts=None):
+    """Render profil layout `layouts` (default: config LAYOUTS) dari satu pembacaan data."""
+    if layouts is None:
+        layouts = config.get('LAYOUTS') or [GraduationPPTGenerator.DEFAULT_PROFILE]
+    profiles = [load_profile(name) for name in layouts]
+    generator = GraduationPPTGenerator(
+        photo_dpi=config.get('PHOTO_DPI'),
+        photo_jpeg_quality=config.get('PHOTO_JPEG_QUALITY'),
+        name_match_threshold=config.get('NAME_MATCH_THRESHOLD'),
+        timing_report=config.get('TIMING_REPORT', 'timing_report.json'),
+        incremental=config.get('INCREMENTAL', True),
+        pptx_compresslevel=config.get('PPTX_COMPRESSLEVEL'),
+        pptx_store_media=config.get('PPTX_STORE_MEDIA'),
+        profile=profiles[0],
+        save_queue_size=config.get('SAVE_QUEUE_SIZE'),
+        resume=config.get('RESUME', False),
+        verify_outputs=config.get('VERIFY_OUTPUTS', False),
+    )
+    TEST_MODE = config.get('TEST_MODE', False)
+    PARALLEL = config.get('PARALLEL', False)
+    MAX_WORKERS = config.get('MAX_WORKERS')  # None = jumlah core CPU
+
+    if TEST_MODE:
+        logger.info(f"\n{'='*50}")
+        logger.info("TEST MODE: Generating single PPT for textbox position testing")
+        logger.info(f"{'='*50}")
+        generator.process_graduation_data(test_mode=True, profiles=profiles)
+    else:
+        # Process combined data with session separation
+        logger.info(f"\n{'='*50}")
+        logger.info(f"Processing data with session and seat separation ({', '.join(p.name for p in profiles)})")
+        logger.info(f"{'='*50}")
+        
+        generator.process_graduation_data(parallel=PARALLEL, max_workers=MAX_WORKERS, profiles=profiles)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate graduation PPT decks from layout profiles (profiles/*.json).')
+    parser.add_argument('--layouts', nargs='+', metavar='LAYOUT',
+                        help='profil layout yang dirender dalam satu run (nama di profiles/ atau path .json; '
+                             f'default: LAYOUTS di config.json). Tersedia: {", ".join(available_profiles())}')
+    parser.add_argument('--profile', nargs='?', const='profile.pstats', metavar='PSTATS_FILE',
+                        help='jalankan di bawah cProfile dan simpan statistik (default: profile.pstats); '
+                             'di mode PARALLEL hanya proses utama yang ter-profile')
+    parser.add_argument('--resume', action='store_true',
+                        help='lanjutkan run yang terputus: deck yang tercatat selesai di journal '
+                             '(.build_journal.jsonl) dan file-nya utuh dilewati, sisanya dibangun ulang')
+    args = parser.parse_args(argv)
+
+    # Load TEST_MODE from config file
+    config = load_config()
+    if args.resume:
+        config['RESUME'] = True
+    setup_logging(config.get('LOG_LEVEL', 'INFO'), config.get('LOG_FILE'))
+
+    if not args.profile:
+        run(config, args.layouts)
+        return
+
+    profiler = cProfile.Profile()
+    profiler.runcall(run, config, args.layouts)
+    profiler.dump_stats(args.profile)
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(25)
+    logger.info(f"\nProfile saved to {args.profile} (top 25 by cumulative time):\n{stream.getvalue()}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file